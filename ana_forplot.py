@@ -1,16 +1,34 @@
 # import MySQLdb
-import time
-import os
-import subprocess
-from subprocess import PIPE
-import math
+import itertools
 
 import numpy as np
-import matplotlib.pyplot as plt
-import numpy
-
-import sys
-
+import pandas as pd
+
+try:
+	from scipy.spatial import cKDTree
+	HAS_SCIPY = True
+except ImportError:
+	HAS_SCIPY = False
+
+# row formats of the GMT input files
+FMT_TIME = "%8.3f %8.3f %5.2f \n"
+FMT_LOC_ERR = "%8.3f %8.3f %5.2f %5.2f %8.3f %8.3f \n"
+FMT_EVENT = "%8.3f %8.3f %8.3f %8.3f \n"
+FMT_MAG = "%8.3f %8.3f \n"
+
+# the row format is repeated once per row and applied in a single % call,
+# then written as one buffered block
+OUT_BUFSIZE = 1<<20
+def save_rows(name, rows, fmt):
+	rows = np.asarray(rows, dtype=np.float64)
+	with open(name, "wb", buffering=OUT_BUFSIZE) as f:
+		f.write(((fmt*len(rows)) % tuple(rows.ravel().tolist())).encode())
+
+# root-mean-square, used for the magnitude error
+def rms(x):
+	return np.sqrt(np.mean(np.square(x)))
+
+# epicentral distance in km; arguments may be scalars or numpy arrays
 def delaz( elat, elon, slat,  slon):
 	avlat=0.5*(elat+slat);
 	a=1.840708+avlat*(.0015269+avlat*(-.00034+avlat*(1.02337e-6)));
@@ -19,53 +37,73 @@ def delaz( elat, elon, slat,  slon):
 	dlon=slon-elon;
 	dx=a*dlon*60.0;
 	dy=b*dlat*60.0;
-	delta=math.sqrt(dx*dx+dy*dy);
+	delta=np.sqrt(dx*dx+dy*dy);
 	return delta;
 
+# Franklin's PNPOLY crossing-number test, broadcast over (points, edges);
+# the closing edge is added with np.roll (degenerate when the ring is closed)
+def points_in_polygon(px, py, vx, vy):
+	px = np.asarray(px, dtype=float)[:,None]
+	py = np.asarray(py, dtype=float)[:,None]
+	x1 = vx
+	y1 = vy
+	x2 = np.roll(vx,-1)
+	y2 = np.roll(vy,-1)
+	with np.errstate(divide='ignore', invalid='ignore'):
+		cross = ((y1>py)!=(y2>py)) & (px<(x2-x1)*(py-y1)/(y2-y1)+x1)
+	return np.logical_xor.reduce(cross, axis=1)
+
+# planar km coordinates around the boundary centre, using delaz's scale
+# factors at the centre latitude; only used to pick KD-tree candidates
+def boundary_xy(lon, lat):
+	avlat = tcen[1]
+	a=1.840708+avlat*(.0015269+avlat*(-.00034+avlat*(1.02337e-6)));
+	b=1.843404+avlat*(-6.93799e-5+avlat*(8.79993e-6+avlat*(-6.47527e-8)));
+	return np.column_stack([a*(lon-tcen[0])*60.0, b*(lat-tcen[1])*60.0])
+
+def near_boundary(elon, elat, r):
+	# the projection is off by a few percent away from the centre latitude,
+	# so (event, boundary point) pairs are gathered with a margin and all
+	# confirmed with one delaz call
+	pairs = cKDTree(boundary_xy(elon, elat)).sparse_distance_matrix(ttree, r*1.1, output_type='ndarray')
+	i, j = pairs['i'], pairs['j']
+	near = np.zeros(len(elon), dtype=bool)
+	near[i[delaz(elat[i], elon[i], tlat[j], tlon[j])<r]] = True
+	return near
+
 def check_seis_r(tlon, tlat, elon, elat, num_boundary, r):
-	sta=[]
-	result=0
-	for	 i in range(1,num_boundary):
-		x=tlon[i]-elon
-		y=tlat[i]-elat
-		dist=delaz(elat,elon,tlat[i],tlon[i])
-			
-		for j in range(1,6):
-			sta.append(0)
-		
-		if x>0 and y>0:
-			sta[0]=1
-		if x<0 and y<0:
-			sta[1]=1
-		if x>0 and y<0:
-			sta[2]=1
-		if x<0 and y>0:
-			sta[3]=1
-		if dist<r:
-			sta[4]=1		
-	
-		check = sta[0]*sta[1]*sta[2]*sta[3]
-		
-		if check==1 or sta[4]==1:
-			result=1
-			break
-	return result	
+	# inland if the event lies inside the boundary polygon or closer than r km
+	# to a boundary point; elon/elat are arrays and one flag is returned per event
+	elon = np.asarray(elon, dtype=float)
+	elat = np.asarray(elat, dtype=float)
+	tlon = tlon[:num_boundary]
+	tlat = tlat[:num_boundary]
+	result = np.zeros(len(elon), dtype=int)
+
+	# only events inside the boundary box padded by r can be inland
+	# (1 km < 0.01 deg at Taiwan latitudes)
+	pad = r/100.0
+	box = (elon>=tbox[0]-pad) & (elon<=tbox[1]+pad) & (elat>=tbox[2]-pad) & (elat<=tbox[3]+pad)
+	if not box.any():
+		return result
+
+	lon = elon[box]
+	lat = elat[box]
+	inside = points_in_polygon(lon, lat, tlon, tlat)
+	if ttree is not None:
+		near = near_boundary(lon, lat, r)
+	else:
+		near = np.any(delaz(lat[:,None], lon[:,None], tlat, tlon)<r, axis=1)
+	result[box] = inside | near
+	return result
 	
-tlon=[]
-tlat=[]
-g = open("taiwan.txt","r")
-n=0
-for j in g.readlines():
-	data = j.split()	
-	n = n + 1
-	dd = float(data[0])
-	tlon.append(dd)
-	dd = float(data[1])
-	tlat.append(dd)	
-	# print '--%5d %8s %8s' %(n,data[0],data[1])
-# print 'n = ', n
-num_boundary = n;
-g.close()
+tlon, tlat = np.loadtxt("taiwan.txt", dtype=np.float64, usecols=(0, 1), ndmin=2, unpack=True)
+num_boundary = len(tlon)
+# bounding box of the boundary, used by check_seis_r to skip distant events
+tbox = (tlon.min(), tlon.max(), tlat.min(), tlat.max())
+# KD-tree over the boundary points for the near-coast test (scipy optional)
+tcen = (tlon.mean(), tlat.mean())
+ttree = cKDTree(boundary_xy(tlon, tlat)) if HAS_SCIPY else None
 	
 # file = open("0206-tcpd-aftershock.txt","r")
 # file = open("0206-tcpd-new.txt","r")
@@ -93,7 +131,7 @@ g.close()
 # file = open("EEW_ALL-2021-2022-EOS-F42.txt","r")
 # file = open("EEW_ALL-2014-2024.txt","r",encoding="utf-8")
 
-file = open("EEW-2024.txt","r",encoding="utf-8")
+data_file = "EEW-2024.txt"
 
 
 #EEW_ALL-2021-2022-EOS-F42.txt
@@ -101,397 +139,207 @@ file = open("EEW-2024.txt","r",encoding="utf-8")
 #EEW_ALL-2014-2021.txt
 
 
-
-f1 = open("dis_pro_time","w")
-f2 = open("dot","w")
-f3 = open("miss","w")
-f4 = open("dis_loc_err","w")
-f5 = open("no","w")
-f6 = open("yes","w")
-f7 = open("dot_dis_err","w")
-f8 = open("cmag_emag","w")
-
-f9 = open("dis_loc_err_last","w")   # f4
-f10 = open("cmag_emag_last","w")    # f8
-f11 = open("dis_pro_time_last","w") # f1
-
-
-f_all_time_05 = open("pro_time_05","w")
-f_all_time_10 = open("pro_time_10","w")
-f_all_time_15 = open("pro_time_15","w")
-f_all_time_20 = open("pro_time_20","w")
-f_all_time_25 = open("pro_time_25","w")
-f_all_time_30 = open("pro_time_30","w")
-
-
-aa=0
 fac=0.03
 fac_dis_err=0.018
 
-all_time=[]
-inland_time=[]
-offshore_time=[]
-
-all_time_f42=[]
-inland_time_f42=[]
-offshore_time_f42=[]
-
-inland_loc=[]
-offshore_loc=[]
-
-inland_loc_f42=[]
-offshore_loc_f42=[]
-
-
-miss_mag=[]
-miss_dep=[]
-count_Y=0
-count_N=0
-count_L=0
-loc_err=[]
-mag_err=[]
-
-loc_inland_err=[]
-mag_inland_err=[]
-loc_offshore_err=[]
-mag_offshore_err=[]
-
-loc_inland_err_f42=[]
-mag_inland_err_f42=[]
-loc_offshore_err_f42=[]
-mag_offshore_err_f42=[]
-
-
-arrmag_sd=[]
-
 near_coast_line_dis = 1.0
 
-for rr in file.readlines():
-	# rr = rr.strip()
-
-	print ("---"+rr)
-	
-	
-	qq11 = rr.split()
-	# print qq11
-	
-	print("len: qq11 : ", len(qq11))
-	
-	lonn1 = float(qq11[3])
-	latt1 = float(qq11[4])
-	magg1 = float(qq11[5])	
-	depp1 = float(qq11[6])
-	# if lonn1 < 119:
-		# continue		
-	# if latt1 <= 21:
-		# continue		
-        
-	if magg1 < 5.0:
-		continue		
-	if depp1 > 40.0:
-		continue
-		
-	if rr[1]== 'Y':
-		# print rr        rr=rr.strip('\n')
-
-		qq = rr.split()
-		lon1 = float(qq[3])
-		lat1 = float(qq[4])
-		mag1 = float(qq[5])		
-		dep1 = float(qq[6])
-		lon2 = float(qq[7])
-		lat2 = float(qq[8])			
-		mag2 = float(qq[9])	
-		
-		if lat1 < 21.0:
-			continue
-			
-		if lat1 > 26.0:
-			continue			
-
-		if lon1 < 119:
-			continue	
-		
-		if lon1 > 123:
-			continue		
-		
-		if dep1 > 40:
-			continue
-			
-		if mag1 < 5.0:
-			continue	
-
-            
-		# print( rr)
-        
-		# if mag1 < 4.0:
-			# continue		        
-	
-		pro_time = float(qq[11] )	
-        
-        
-	        
-        
-		if len(qq)>12:
-			pro_time1 = float(qq[12])
-		else:
-			pro_time1 = 0.0
-            
-            
-		# if pro_time > 11.0:
-			# continue            
-            
-		dis = delaz( lat1, lon1, lat2, lon2)
-		diff = abs(mag1-mag2)
-		arrmag_sd.append(diff*diff)
-		
-		flag=check_seis_r(tlon, tlat, lon1, lat1, num_boundary, near_coast_line_dis)
-		
-		# if flag!=1:
-			# continue
-            
-		# if flag==1:
-			# continue            
-		
-		# if pro_time < 30:
-			# continue        
-        
-		# if pro_time >= 11:
-			# continue
-            
-		# if pro_time < 40:
-			# continue            
-			
-		if pro_time > 15 and lon1 > 121 and lat1 > 23  and lat1 < 23.7:
-			print ("-----------")
-			print (rr)
-			print (pro_time)
-			print ("-----------")
-		if dis > 50 :
-			print ("-----------")
-			print (rr)
-			print (dis)
-			print ("-----------")            
-		count_Y +=1			
-		# print count_Y,qq[1],lon1,lat1,mag1,lon2,lat2,mag2, dis, diff, pro_time
-		# if dis < 10:
-		# print(rr)
-		
-		with open ("data.dat","a") as fp:
-			fp.write(rr)
-		
-		
-		f1.write("%8.3f %8.3f %5.2f \n"%(lon1,lat1,fac*pro_time));
-		f4.write("%8.3f %8.3f %5.2f %5.2f %8.3f %8.3f \n"%(lon1,lat1,fac_dis_err*dis,dis,dep1, mag1));	
-		f6.write("%8.3f %8.3f %8.3f %8.3f \n"%(lon1,lat1,dep1, mag1));		
-		f8.write("%8.3f %8.3f \n"%(mag1, mag2));	
-
-		if pro_time<= 10:
-			f_all_time_05.write( "%8.3f %8.3f %5.2f \n"%(lon1,lat1,fac*pro_time) )
-            
-		if pro_time> 10 and pro_time<=15:
-			f_all_time_10.write( "%8.3f %8.3f %5.2f \n"%(lon1,lat1,fac*pro_time) )
-            
-		if pro_time> 15 and pro_time<=20:
-			f_all_time_15.write( "%8.3f %8.3f %5.2f \n"%(lon1,lat1,fac*pro_time) )
-            
-		if pro_time> 20 and pro_time<=25:
-			f_all_time_20.write( "%8.3f %8.3f %5.2f \n"%(lon1,lat1,fac*pro_time) ) 
-            
-		if pro_time> 25 and pro_time<=30:
-			f_all_time_25.write( "%8.3f %8.3f %5.2f \n"%(lon1,lat1,fac*pro_time) )
-            
-		if pro_time> 30:
-			f_all_time_30.write( "%8.3f %8.3f %5.2f \n"%(lon1,lat1,fac*pro_time) )
-            
-		# if rr[0]=='o':
-			# gg = rr.split()
-			# print gg
-			# lon3 = float(gg[12])
-			# lat3 = float(gg[13])
-			# mag3 = float(gg[14])				
-			# pro_time3 = float(gg[16])
-			
-			# dis_last = delaz( lat1, lon1, lat3, lon3)
-			# diff = abs(mag1-mag2)	
-			
-			# f11.write("%8.3f %8.3f %5.2f \n"%(lon1,lat1,fac*pro_time3));
-			# f9.write("%8.3f %8.3f %5.2f %5.2f %8.3f %8.3f \n"%(lon1,lat1,fac_dis_err*dis_last,dis_last,dep1, mag1));			
-			# f10.write("%8.3f %8.3f \n"%(mag1, mag2));
-		
-		loc_err.append(dis)
-		mag_err.append(diff)		
-		
-		all_time.append(pro_time)
-		if pro_time1<0.1:
-			pass
-		else:
-			all_time_f42.append(pro_time1)
-		
-		if flag==1:
-			inland_time.append(pro_time)
-			inland_loc.append(dis)
-			loc_inland_err.append(dis)
-			mag_inland_err.append(diff*diff)
-			
-			if pro_time1<0.1:
-				pass
-			else:
-				inland_time_f42.append(pro_time1) 
-				loc_inland_err_f42.append(dis)
-				mag_inland_err_f42.append(diff*diff)            
-		
-		if flag!=1:
-			offshore_time.append(pro_time)
-			offshore_loc.append(dis)
-			loc_offshore_err.append(dis)
-			mag_offshore_err.append(diff*diff)			
-			
-			if pro_time1<0.1:
-				pass
-			else:
-				offshore_time_f42.append(pro_time1)      
-				loc_offshore_err_f42.append(dis)
-				mag_offshore_err_f42.append(diff*diff)           
-		
-		
-	if rr[1]== 'N':
-
-
-		qq = rr.split()
-		lon1 = float(qq[3])
-		lat1 = float(qq[4])	
-		mag1 = float(qq[5])		
-		dep1 = float(qq[6])
-		count_N +=1		
-		f5.write("%8.3f %8.3f %8.3f %8.3f \n"%(lon1,lat1,dep1, mag1));		
-		# print count_N,qq[1],lon1,lat1,mag1,dep1	
-		
-	if rr[1]== 'L':
-		# print rr
-		
-		# print '-----1'
-		# print (rr )
-		# print '-----2'
-		
-		qq = rr.split()
-		lon1 = float(qq[3])
-		lat1 = float(qq[4])	
-		mag1 = float(qq[5])		
-		dep1 = float(qq[6])
-		
-		# if mag1 < 5.0:
-			# continue	
-			
-		count_L +=1			
-		print( '-------------------===========================',count_L,qq[1],lon1,lat1,mag1,dep1		)
-		f3.write("%8.3f %8.3f %8.3f %8.3f \n"%(lon1,lat1,dep1, mag1));
-		miss_mag.append(mag1)
-		miss_dep.append(dep1)
-
-f2.write('120.03 25.20 %f \n'% ( 15 * fac) )
-f2.write('120.03 24.95 %f \n'% ( 20 * fac) )
-f2.write('120.03 24.70 %f \n'% ( 25 * fac) )
-f2.write('120.03 24.45 %f \n'% ( 30 * fac) )
-
-f7.write('120.03 25.20 %f \n'% ( 10 * fac_dis_err) )
-f7.write('120.03 24.95 %f \n'% ( 20 * fac_dis_err) )
-f7.write('120.03 24.70 %f \n'% ( 40 * fac_dis_err) )
-f7.write('120.03 24.45 %f \n'% ( 80 * fac_dis_err) )
-		
-file.close()
-f1.close()
-f2.close()
-f3.close()
-f4.close()
-f5.close()
-f6.close()
-f7.close()
-f8.close()
-
-f9.close()
-f10.close()
-f11.close()
-
-f_all_time_05.close()
-f_all_time_10.close()
-f_all_time_15.close()
-f_all_time_20.close()
-f_all_time_25.close()
-f_all_time_30.close()
+# Load the whole catalog in one pass instead of parsing it line by line.
+# N/L rows only carry the 7 catalog columns; the EEW columns come back as NaN.
+# Blank lines are kept so that row i of `eew` is still line i of the file.
+# Fields past the 13th are ignored; the C parser rejects such lines, so only
+# then fall back to the (slower) python engine, which can drop them.
+eew_names = ["type","no","time","lon1","lat1","mag1","dep1","lon2","lat2","mag2","dep2","pro_time","pro_time1"]
+with open(data_file,"r",encoding="utf-8") as file:
+	try:
+		eew = pd.read_csv(file, sep=r"\s+", header=None, skip_blank_lines=False,
+			names=eew_names, dtype={"type": str, "no": str, "time": str})
+	except pd.errors.ParserError:
+		file.seek(0)
+		eew = pd.read_csv(file, sep=r"\s+", header=None, skip_blank_lines=False, engine="python",
+			names=eew_names, usecols=lambda c: c in eew_names, dtype={"type": str, "no": str, "time": str})
+
+kind = eew["type"].str[1].to_numpy()
+lon_all = eew["lon1"].to_numpy()
+lat_all = eew["lat1"].to_numpy()
+mag_all = eew["mag1"].to_numpy()
+dep_all = eew["dep1"].to_numpy()
+
+m_all = (mag_all >= 5.0) & (dep_all <= 40.0)
+m_yes = m_all & (kind == 'Y') & (lat_all >= 21.0) & (lat_all <= 26.0) & (lon_all >= 119) & (lon_all <= 123)
+m_no = m_all & (kind == 'N')
+m_miss = m_all & (kind == 'L')
+
+yes = eew[m_yes]
+lon1 = yes["lon1"].to_numpy()
+lat1 = yes["lat1"].to_numpy()
+mag1 = yes["mag1"].to_numpy()
+dep1 = yes["dep1"].to_numpy()
+lon2 = yes["lon2"].to_numpy()
+lat2 = yes["lat2"].to_numpy()
+mag2 = yes["mag2"].to_numpy()
+pro_time = yes["pro_time"].to_numpy()
+pro_time1 = yes["pro_time1"].fillna(0.0).to_numpy()
+
+dis = delaz( lat1, lon1, lat2, lon2)
+diff = np.abs(mag1-mag2)
+
+flag = check_seis_r(tlon, tlat, lon1, lat1, num_boundary, near_coast_line_dis)
+inland = flag==1
+f42 = pro_time1>=0.1
+
+# raw text of the accepted rows, picked out in a second streaming pass
+with open(data_file,"r",encoding="utf-8") as file:
+	rr_yes = np.array(list(itertools.compress(file, m_yes)), dtype=object)
+slow = (pro_time > 15) & (lon1 > 121) & (lat1 > 23) & (lat1 < 23.7)
+for rr, t in zip(rr_yes[slow], pro_time[slow]):
+	print ("-----------")
+	print (rr)
+	print (t)
+	print ("-----------")
+for rr, d in zip(rr_yes[dis > 50], dis[dis > 50]):
+	print ("-----------")
+	print (rr)
+	print (d)
+	print ("-----------")
+
+count_Y = int(m_yes.sum())
+count_N = int(m_no.sum())
+count_L = int(m_miss.sum())
+
+with open ("data.dat","a",buffering=OUT_BUFSIZE) as fp:
+	fp.writelines(rr_yes)
+
+save_rows("dis_pro_time", np.column_stack([lon1,lat1,fac*pro_time]), FMT_TIME)
+save_rows("dis_loc_err", np.column_stack([lon1,lat1,fac_dis_err*dis,dis,dep1,mag1]), FMT_LOC_ERR)
+save_rows("yes", np.column_stack([lon1,lat1,dep1,mag1]), FMT_EVENT)
+save_rows("cmag_emag", np.column_stack([mag1,mag2]), FMT_MAG)
+
+# pro_time <= 10, (10,15], (15,20], (20,25], (25,30], > 30
+time_bin = np.digitize(pro_time, [10, 15, 20, 25, 30], right=True)
+time_rows = np.column_stack([lon1,lat1,fac*pro_time])
+for b, name in enumerate(["pro_time_05","pro_time_10","pro_time_15","pro_time_20","pro_time_25","pro_time_30"]):
+	save_rows(name, time_rows[time_bin==b], FMT_TIME)
+
+# the "_last" outputs (see the commented-out 'o' branch below) are only truncated
+for name in ("dis_loc_err_last", "cmag_emag_last", "dis_pro_time_last"):
+	open(name,"w").close()
+
+# if rr[0]=='o':
+	# gg = rr.split()
+	# print gg
+	# lon3 = float(gg[12])
+	# lat3 = float(gg[13])
+	# mag3 = float(gg[14])
+	# pro_time3 = float(gg[16])
+
+	# dis_last = delaz( lat1, lon1, lat3, lon3)
+	# diff = abs(mag1-mag2)
+
+	# f11.write("%8.3f %8.3f %5.2f \n"%(lon1,lat1,fac*pro_time3));
+	# f9.write("%8.3f %8.3f %5.2f %5.2f %8.3f %8.3f \n"%(lon1,lat1,fac_dis_err*dis_last,dis_last,dep1, mag1));
+	# f10.write("%8.3f %8.3f \n"%(mag1, mag2));
+
+loc_err = dis
+mag_err = diff
+
+all_time = pro_time
+all_time_f42 = pro_time1[f42]
+
+inland_time = pro_time[inland]
+loc_inland_err = dis[inland]
+mag_inland_err = diff[inland]
+inland_time_f42 = pro_time1[inland & f42]
+loc_inland_err_f42 = dis[inland & f42]
+mag_inland_err_f42 = diff[inland & f42]
+
+offshore_time = pro_time[~inland]
+loc_offshore_err = dis[~inland]
+mag_offshore_err = diff[~inland]
+offshore_time_f42 = pro_time1[~inland & f42]
+loc_offshore_err_f42 = dis[~inland & f42]
+mag_offshore_err_f42 = diff[~inland & f42]
+
+no = eew[m_no]
+save_rows("no", np.column_stack([no["lon1"],no["lat1"],no["dep1"],no["mag1"]]), FMT_EVENT)
+
+miss = eew[m_miss]
+for n, (qq1, lon, lat, mag, dep) in enumerate(zip(miss["no"], miss["lon1"], miss["lat1"], miss["mag1"], miss["dep1"]), 1):
+	print( '-------------------===========================',n,qq1,lon,lat,mag,dep		)
+save_rows("miss", np.column_stack([miss["lon1"],miss["lat1"],miss["dep1"],miss["mag1"]]), FMT_EVENT)
+miss_mag = miss["mag1"].to_numpy()
+miss_dep = miss["dep1"].to_numpy()
+
+# legend symbols for the processing-time and location-error maps
+legend_lat = (25.20, 24.95, 24.70, 24.45)
+with open("dot","w") as f2:
+	f2.write("".join('120.03 %.2f %f \n'%(la, t*fac) for la, t in zip(legend_lat, (15,20,25,30))))
+
+with open("dot_dis_err","w") as f7:
+	f7.write("".join('120.03 %.2f %f \n'%(la, d*fac_dis_err) for la, d in zip(legend_lat, (10,20,40,80))))
 
 
 print ('\n\n')
-print ('1_inland: ',inland_time)
-print ('2_offshore: ',offshore_time)
-print ('3_inland: ',inland_time_f42)
-print ('4_offshore: ',offshore_time_f42)
+print ('1_inland: ',inland_time.tolist())
+print ('2_offshore: ',offshore_time.tolist())
+print ('3_inland: ',inland_time_f42.tolist())
+print ('4_offshore: ',offshore_time_f42.tolist())
 print ('\n\n')
 print ('count_Y,N,L: ', count_Y, count_N, count_L)
 print ('\n\n')
-print ('miss_mag: ',miss_mag)
-print ('AVG: ',numpy.mean(miss_mag), 'STD: ',numpy.std(miss_mag))
+print ('miss_mag: ',miss_mag.tolist())
+print ('AVG: ',np.mean(miss_mag), 'STD: ',np.std(miss_mag))
 # print 'miss_dep: ',miss_dep
-# print 'AVG: ',numpy.mean(miss_dep), 'STD: ',numpy.std(miss_dep)
+# print 'AVG: ',np.mean(miss_dep), 'STD: ',np.std(miss_dep)
 print ('\n\n')
-print ('loc_err AVG: ',numpy.mean(loc_err), 'loc_err STD: ',numpy.std(loc_err))
-print ('mag_err AVG: ',numpy.mean(mag_err), 'STD: ',numpy.std(mag_err))
+print ('loc_err AVG: ',np.mean(loc_err), 'loc_err STD: ',np.std(loc_err))
+print ('mag_err AVG: ',np.mean(mag_err), 'STD: ',np.std(mag_err))
 
 # print 'loc_err: ', loc_err
 
-arr1 = numpy.array(inland_time)
-arr2 = numpy.array(offshore_time)
+arr1 = np.array(inland_time)
+arr2 = np.array(offshore_time)
 f1=open("time_txt1","w")
-f1.write("119.991 21.77 14.5 0 9 ML Inland Average: %.1f \261 %.1f sec\n"%(numpy.mean(arr1),numpy.std(arr1)))
-f1.write("119.991 21.63 14.5 0 9 ML Offshore Average: %.1f \261 %.1f sec\n"%(numpy.mean(arr2),numpy.std(arr2)))
+f1.write("119.991 21.77 14.5 0 9 ML Inland Average: %.1f \261 %.1f sec\n"%(np.mean(arr1),np.std(arr1))
+	+ "119.991 21.63 14.5 0 9 ML Offshore Average: %.1f \261 %.1f sec\n"%(np.mean(arr2),np.std(arr2)))
 f1.close()
 
 
 
 
-# arr1 = numpy.array(loc_inland_err)
-# arr2 = numpy.array(loc_offshore_err)
-# print "loc_inland_err Inland Average: %.1f \261 %.1f sec\n"%(numpy.mean(loc_inland_err),numpy.std(loc_inland_err)))
-# print "loc_offshore_err Offshore Average: %.1f \261 %.1f sec\n"%(numpy.mean(loc_offshore_err),numpy.std(loc_offshore_err)))
+# arr1 = np.array(loc_inland_err)
+# arr2 = np.array(loc_offshore_err)
+# print "loc_inland_err Inland Average: %.1f \261 %.1f sec\n"%(np.mean(loc_inland_err),np.std(loc_inland_err)))
+# print "loc_offshore_err Offshore Average: %.1f \261 %.1f sec\n"%(np.mean(loc_offshore_err),np.std(loc_offshore_err)))
 
 print ("\n\n")
-arr1 = numpy.array(loc_inland_err)
-arr2 = numpy.array(loc_offshore_err)
-print ("loc_inland_err Inland Average: ", numpy.mean(loc_inland_err), "   ",numpy.std(loc_inland_err))
-print ("loc_offshore_err Offshore Average: ", numpy.mean(loc_offshore_err),"   ", numpy.std(loc_offshore_err))
+arr1 = np.array(loc_inland_err)
+arr2 = np.array(loc_offshore_err)
+print ("loc_inland_err Inland Average: ", np.mean(loc_inland_err), "   ",np.std(loc_inland_err))
+print ("loc_offshore_err Offshore Average: ", np.mean(loc_offshore_err),"   ", np.std(loc_offshore_err))
 
 
 print ("\n\n")
-arr1 = numpy.array(loc_inland_err)
-arr2 = numpy.array(loc_offshore_err)
-print ("loc_inland_err Inland Average f42: ", numpy.mean(loc_inland_err_f42), "   ",numpy.std(loc_inland_err_f42))
-print ("loc_offshore_err Offshore Average f42: ", numpy.mean(loc_offshore_err_f42),"   ", numpy.std(loc_offshore_err_f42))
+arr1 = np.array(loc_inland_err)
+arr2 = np.array(loc_offshore_err)
+print ("loc_inland_err Inland Average f42: ", np.mean(loc_inland_err_f42), "   ",np.std(loc_inland_err_f42))
+print ("loc_offshore_err Offshore Average f42: ", np.mean(loc_offshore_err_f42),"   ", np.std(loc_offshore_err_f42))
 
 print ("\n\n")
-# arr1 = numpy.array(mag_inland_err)
-# arr2 = numpy.array(mag_offshore_err)
-
+# arr1 = np.array(mag_inland_err)
+# arr2 = np.array(mag_offshore_err)
 
-arr1 = np.array(mag_inland_err)
-ss1_in = np.mean(arr1)
-ss2_in = np.sqrt(ss1_in)
 
-arr2 = np.array(mag_offshore_err)
-ss1_off = np.mean(arr2)
-ss2_off = np.sqrt(ss1_off)
+ss2_in = rms(mag_inland_err)
+ss2_off = rms(mag_offshore_err)
 
 print ("mag_inland_err Inland Average: ", ss2_in)
 print ("mag_offshore_err Offshore Average: ", ss2_off)
 
 
 
-arr1 = np.array(mag_inland_err_f42)
-ss1_in = np.mean(arr1)
-ss2_in = np.sqrt(ss1_in)
-
-arr2 = np.array(mag_offshore_err_f42)
-ss1_off = np.mean(arr2)
-ss2_off = np.sqrt(ss1_off)
+ss2_in = rms(mag_inland_err_f42)
+ss2_off = rms(mag_offshore_err_f42)
 
 print ("mag_inland_err_f42 Inland Average: ", ss2_in)
 print ("mag_offshore_err_f42 Offshore Average: ", ss2_off)
@@ -500,12 +348,12 @@ print ("mag_offshore_err_f42 Offshore Average: ", ss2_off)
 
 
 print ('\n\n')
-arr1 = numpy.array(inland_time)
-arr2 = numpy.array(offshore_time)
-arr3 = numpy.array(all_time)
-print ('Process Time Inland AVG: ',numpy.mean(arr1), ' STD: ',numpy.std(arr1),numpy.shape(arr1))
-print ('Process Time Offshore AVG: ',numpy.mean(arr2), 'STD: ',numpy.std(arr2),numpy.shape(arr2))
-print ('Process Time  AVG: ',numpy.mean(arr3), 'STD: ',numpy.std(arr3),numpy.shape(arr3))
+arr1 = np.array(inland_time)
+arr2 = np.array(offshore_time)
+arr3 = np.array(all_time)
+print ('Process Time Inland AVG: ',np.mean(arr1), ' STD: ',np.std(arr1),np.shape(arr1))
+print ('Process Time Offshore AVG: ',np.mean(arr2), 'STD: ',np.std(arr2),np.shape(arr2))
+print ('Process Time  AVG: ',np.mean(arr3), 'STD: ',np.std(arr3),np.shape(arr3))
 
 print ("inland number: "+str(len(inland_time)))
 print ("offshore number: "+str(len(offshore_time)))
@@ -513,12 +361,12 @@ print ("total number", len(inland_time)+len(offshore_time))
 
 
 print ('\n\n')
-arr1 = numpy.array(inland_time_f42)
-arr2 = numpy.array(offshore_time_f42)
-arr3 = numpy.array(all_time_f42)
-print ('Process Time Inland_f42 AVG: ',numpy.mean(arr1), ' STD: ',numpy.std(arr1),numpy.shape(arr1))
-print ('Process Time Offshore_f42 AVG: ',numpy.mean(arr2), 'STD: ',numpy.std(arr2),numpy.shape(arr2))
-print ('Process Time f42 AVG: ',numpy.mean(arr3), 'STD: ',numpy.std(arr3),numpy.shape(arr3))
+arr1 = np.array(inland_time_f42)
+arr2 = np.array(offshore_time_f42)
+arr3 = np.array(all_time_f42)
+print ('Process Time Inland_f42 AVG: ',np.mean(arr1), ' STD: ',np.std(arr1),np.shape(arr1))
+print ('Process Time Offshore_f42 AVG: ',np.mean(arr2), 'STD: ',np.std(arr2),np.shape(arr2))
+print ('Process Time f42 AVG: ',np.mean(arr3), 'STD: ',np.std(arr3),np.shape(arr3))
 
 print ("inland_f42 number: "+str(len(inland_time_f42)))
 print ("offshore_f42 number: "+str(len(offshore_time_f42)))
@@ -527,18 +375,11 @@ print ("total_f42 number", len(inland_time_f42)+len(offshore_time_f42))
 
 f1=open("mag_line_std","w")
 
-arr = np.array(arrmag_sd)
-ss1 = np.mean(arr)
-ss2 = np.sqrt(ss1)
+ss2 = rms(diff)
 
 print ('-----------------ss2:', ss2)
 
-f1.write("0 %f \n"%(0+ss2))
-f1.write("8 %f \n"%(8+ss2))
-f1.write(">> \n")
-f1.write("0 %f \n"%(0-ss2))
-f1.write("8 %f \n"%(8-ss2))
-f1.write(">> \n")
+f1.write("0 %f \n8 %f \n>> \n0 %f \n8 %f \n>> \n"%(0+ss2, 8+ss2, 0-ss2, 8-ss2))
 f1.close()
 f1=open("mag_txt","w")
 f1.write("5.5 4.6 12 0 9 ML M@-L @-= M@-Pd @-SDV: %.1f \n"%(ss2))
@@ -11,6 +11,16 @@ import numpy as np
 from eews_analyzer import EEWSAnalyzer
 
 
+def group_stats(df):
+    """Mean, std and RMS of the error columns in a single aggregation."""
+    cols = ['Processing_Time', 'Epicenter_Error_km', 'Magnitude_Error']
+    st = df[cols].agg(['mean', 'std', lambda x: np.sqrt((x**2).mean())])
+    st.index = ['mean', 'std', 'rms']
+    st = st.to_dict()
+    st['count'] = len(df)
+    return st
+
+
 def main():
     print("\n" + "="*80)
     print("地震预警系统性能统计分析 (2014-2025)")
@@ -43,14 +53,10 @@ def main():
     print("-"*80)
     
     original_count = len(analyzer.df)
-    analyzer.df = analyzer.df[
-        (analyzer.df['Cat_Mag'] > min_mag) & 
-        (analyzer.df['Cat_Depth'] < max_depth) &
-        (analyzer.df['Cat_Lon'] >= min_lon) & 
-        (analyzer.df['Cat_Lon'] <= max_lon) &
-        (analyzer.df['Cat_Lat'] >= min_lat) & 
-        (analyzer.df['Cat_Lat'] <= max_lat)
-    ]
+    analyzer.df = analyzer.df.query(
+        "Cat_Mag > @min_mag and Cat_Depth < @max_depth and "
+        "@min_lon <= Cat_Lon <= @max_lon and @min_lat <= Cat_Lat <= @max_lat"
+    )
     filtered_count = len(analyzer.df)
     
     print(f"\n符合条件的地震总数: {filtered_count} (筛选前: {original_count})")
@@ -68,13 +74,20 @@ def main():
     
     # Separate inland and offshore events
     if 'Is_Inland' in df_detected.columns:
-        df_inland = df_detected[df_detected['Is_Inland'] == True].copy()
-        df_offshore = df_detected[df_detected['Is_Inland'] == False].copy()
+        # One grouping pass instead of two boolean slices
+        groups = dict(tuple(df_detected.groupby('Is_Inland')))
+        df_inland = groups.get(True, df_detected.iloc[0:0])
+        df_offshore = groups.get(False, df_detected.iloc[0:0])
     else:
         print("\n警告: 无法分类岛内/外海地震，缺少边界数据文件!")
         df_inland = pd.DataFrame()
         df_offshore = pd.DataFrame()
     
+    # Mean/std/RMS for every group, computed once and reused below
+    stats = {name: group_stats(df) for name, df in
+             (('overall', df_detected), ('inland', df_inland), ('offshore', df_offshore))
+             if len(df) > 0}
+    
     # Print comprehensive statistics
     print("\n" + "="*80)
     print("统计结果 (Statistical Results)")
@@ -87,43 +100,31 @@ def main():
     print(f"  未能发布次数 (Missed):                            {filtered_count - len(df_detected)}")
     print(f"  发布率 (Alert rate):                              {len(df_detected)/filtered_count*100:.1f}%")
     
-    if len(df_detected) > 0:
-        print(f"\n  平均处理时效 (Avg processing time):               {df_detected['Processing_Time'].mean():.2f} 秒 (seconds)")
-        print(f"  平均震央误差 (Avg epicenter error):               {df_detected['Epicenter_Error_km'].mean():.2f} 公里 (km)")
-        print(f"  平均规模误差 (Avg magnitude error):               {df_detected['Magnitude_Error'].mean():.3f}")
-        print(f"  规模误差RMS (Magnitude error RMS):                {np.sqrt(np.mean(df_detected['Magnitude_Error']**2)):.3f}")
-    
-    # Inland statistics
-    if len(df_inland) > 0:
-        print("\n" + "-"*80)
-        print("【岛内地震统计 Inland Earthquakes】")
-        print(f"  发布次数 (Number of alerts):                      {len(df_inland)}")
-        print(f"  平均处理时效 (Avg processing time):               {df_inland['Processing_Time'].mean():.2f} 秒 (seconds)")
-        print(f"                                                     标准差 (±{df_inland['Processing_Time'].std():.2f} s)")
-        print(f"  平均震央误差 (Avg epicenter error):               {df_inland['Epicenter_Error_km'].mean():.2f} 公里 (km)")
-        print(f"                                                     标准差 (±{df_inland['Epicenter_Error_km'].std():.2f} km)")
-        print(f"  平均规模误差 (Avg magnitude error):               {df_inland['Magnitude_Error'].mean():.3f}")
-        print(f"                                                     标准差 (±{df_inland['Magnitude_Error'].std():.3f})")
-        print(f"  规模误差RMS (Magnitude error RMS):                {np.sqrt(np.mean(df_inland['Magnitude_Error']**2)):.3f}")
-    else:
-        print("\n【岛内地震统计 Inland Earthquakes】")
-        print("  无数据 (No data)")
-    
-    # Offshore statistics
-    if len(df_offshore) > 0:
-        print("\n" + "-"*80)
-        print("【外海地震统计 Offshore Earthquakes】")
-        print(f"  发布次数 (Number of alerts):                      {len(df_offshore)}")
-        print(f"  平均处理时效 (Avg processing time):               {df_offshore['Processing_Time'].mean():.2f} 秒 (seconds)")
-        print(f"                                                     标准差 (±{df_offshore['Processing_Time'].std():.2f} s)")
-        print(f"  平均震央误差 (Avg epicenter error):               {df_offshore['Epicenter_Error_km'].mean():.2f} 公里 (km)")
-        print(f"                                                     标准差 (±{df_offshore['Epicenter_Error_km'].std():.2f} km)")
-        print(f"  平均规模误差 (Avg magnitude error):               {df_offshore['Magnitude_Error'].mean():.3f}")
-        print(f"                                                     标准差 (±{df_offshore['Magnitude_Error'].std():.3f})")
-        print(f"  规模误差RMS (Magnitude error RMS):                {np.sqrt(np.mean(df_offshore['Magnitude_Error']**2)):.3f}")
-    else:
-        print("\n【外海地震统计 Offshore Earthquakes】")
-        print("  无数据 (No data)")
+    if 'overall' in stats:
+        st = stats['overall']
+        print(f"\n  平均处理时效 (Avg processing time):               {st['Processing_Time']['mean']:.2f} 秒 (seconds)")
+        print(f"  平均震央误差 (Avg epicenter error):               {st['Epicenter_Error_km']['mean']:.2f} 公里 (km)")
+        print(f"  平均规模误差 (Avg magnitude error):               {st['Magnitude_Error']['mean']:.3f}")
+        print(f"  规模误差RMS (Magnitude error RMS):                {st['Magnitude_Error']['rms']:.3f}")
+    
+    # Inland and offshore statistics
+    for key, title in (('inland', "【岛内地震统计 Inland Earthquakes】"),
+                       ('offshore', "【外海地震统计 Offshore Earthquakes】")):
+        if key in stats:
+            st = stats[key]
+            print("\n" + "-"*80)
+            print(title)
+            print(f"  发布次数 (Number of alerts):                      {st['count']}")
+            print(f"  平均处理时效 (Avg processing time):               {st['Processing_Time']['mean']:.2f} 秒 (seconds)")
+            print(f"                                                     标准差 (±{st['Processing_Time']['std']:.2f} s)")
+            print(f"  平均震央误差 (Avg epicenter error):               {st['Epicenter_Error_km']['mean']:.2f} 公里 (km)")
+            print(f"                                                     标准差 (±{st['Epicenter_Error_km']['std']:.2f} km)")
+            print(f"  平均规模误差 (Avg magnitude error):               {st['Magnitude_Error']['mean']:.3f}")
+            print(f"                                                     标准差 (±{st['Magnitude_Error']['std']:.3f})")
+            print(f"  规模误差RMS (Magnitude error RMS):                {st['Magnitude_Error']['rms']:.3f}")
+        else:
+            print("\n" + title)
+            print("  无数据 (No data)")
     
     # Create summary table
     print("\n" + "="*80)
@@ -133,17 +134,10 @@ def main():
     print(f"{'':20} {'Alerts':<12} {'Proc.Time(s)':<16} {'Epi.Error(km)':<18} {'Mag.Error':<12}")
     print("-"*80)
     
-    if len(df_detected) > 0:
-        print(f"{'整体 Overall':<20} {len(df_detected):<12} {df_detected['Processing_Time'].mean():<16.2f} "
-              f"{df_detected['Epicenter_Error_km'].mean():<18.2f} {df_detected['Magnitude_Error'].mean():<12.3f}")
-    
-    if len(df_inland) > 0:
-        print(f"{'岛内 Inland':<20} {len(df_inland):<12} {df_inland['Processing_Time'].mean():<16.2f} "
-              f"{df_inland['Epicenter_Error_km'].mean():<18.2f} {df_inland['Magnitude_Error'].mean():<12.3f}")
-    
-    if len(df_offshore) > 0:
-        print(f"{'外海 Offshore':<20} {len(df_offshore):<12} {df_offshore['Processing_Time'].mean():<16.2f} "
-              f"{df_offshore['Epicenter_Error_km'].mean():<18.2f} {df_offshore['Magnitude_Error'].mean():<12.3f}")
+    labels = {'overall': '整体 Overall', 'inland': '岛内 Inland', 'offshore': '外海 Offshore'}
+    for key, st in stats.items():
+        print(f"{labels[key]:<20} {st['count']:<12} {st['Processing_Time']['mean']:<16.2f} "
+              f"{st['Epicenter_Error_km']['mean']:<18.2f} {st['Magnitude_Error']['mean']:<12.3f}")
     
     print("\n" + "="*80)
     
@@ -155,43 +149,17 @@ def main():
     # Create summary dataframe
     summary_data = []
     
-    if len(df_detected) > 0:
-        summary_data.append({
-            '类别': '整体 Overall',
-            '发布次数': len(df_detected),
-            '平均处理时效(秒)': f"{df_detected['Processing_Time'].mean():.2f}",
-            '处理时效标准差': f"{df_detected['Processing_Time'].std():.2f}",
-            '平均震央误差(km)': f"{df_detected['Epicenter_Error_km'].mean():.2f}",
-            '震央误差标准差': f"{df_detected['Epicenter_Error_km'].std():.2f}",
-            '平均规模误差': f"{df_detected['Magnitude_Error'].mean():.3f}",
-            '规模误差标准差': f"{df_detected['Magnitude_Error'].std():.3f}",
-            '规模误差RMS': f"{np.sqrt(np.mean(df_detected['Magnitude_Error']**2)):.3f}"
-        })
-    
-    if len(df_inland) > 0:
-        summary_data.append({
-            '类别': '岛内 Inland',
-            '发布次数': len(df_inland),
-            '平均处理时效(秒)': f"{df_inland['Processing_Time'].mean():.2f}",
-            '处理时效标准差': f"{df_inland['Processing_Time'].std():.2f}",
-            '平均震央误差(km)': f"{df_inland['Epicenter_Error_km'].mean():.2f}",
-            '震央误差标准差': f"{df_inland['Epicenter_Error_km'].std():.2f}",
-            '平均规模误差': f"{df_inland['Magnitude_Error'].mean():.3f}",
-            '规模误差标准差': f"{df_inland['Magnitude_Error'].std():.3f}",
-            '规模误差RMS': f"{np.sqrt(np.mean(df_inland['Magnitude_Error']**2)):.3f}"
-        })
-    
-    if len(df_offshore) > 0:
+    for key, st in stats.items():
         summary_data.append({
-            '类别': '外海 Offshore',
-            '发布次数': len(df_offshore),
-            '平均处理时效(秒)': f"{df_offshore['Processing_Time'].mean():.2f}",
-            '处理时效标准差': f"{df_offshore['Processing_Time'].std():.2f}",
-            '平均震央误差(km)': f"{df_offshore['Epicenter_Error_km'].mean():.2f}",
-            '震央误差标准差': f"{df_offshore['Epicenter_Error_km'].std():.2f}",
-            '平均规模误差': f"{df_offshore['Magnitude_Error'].mean():.3f}",
-            '规模误差标准差': f"{df_offshore['Magnitude_Error'].std():.3f}",
-            '规模误差RMS': f"{np.sqrt(np.mean(df_offshore['Magnitude_Error']**2)):.3f}"
+            '类别': labels[key],
+            '发布次数': st['count'],
+            '平均处理时效(秒)': f"{st['Processing_Time']['mean']:.2f}",
+            '处理时效标准差': f"{st['Processing_Time']['std']:.2f}",
+            '平均震央误差(km)': f"{st['Epicenter_Error_km']['mean']:.2f}",
+            '震央误差标准差': f"{st['Epicenter_Error_km']['std']:.2f}",
+            '平均规模误差': f"{st['Magnitude_Error']['mean']:.3f}",
+            '规模误差标准差': f"{st['Magnitude_Error']['std']:.3f}",
+            '规模误差RMS': f"{st['Magnitude_Error']['rms']:.3f}"
         })
     
     summary_df = pd.DataFrame(summary_data)
@@ -203,40 +171,35 @@ def main():
     # Save detailed earthquake list
     detail_file = "outputs/earthquake_list_2014_2025.csv"
     
-    # Prepare detailed list with all filtered earthquakes
-    earthquake_list = []
-    for idx, row in analyzer.df.iterrows():
-        # Check if EEW was issued
-        has_eew = 'Y' in str(row['Type'])
-        
-        eq_info = {
-            '序号': row['ID'],
-            '类型': row['Type'],
-            '发生时间': row['Origin_Time'],
-            '经度': f"{row['Cat_Lon']:.4f}",
-            '纬度': f"{row['Cat_Lat']:.4f}",
-            '规模': f"{row['Cat_Mag']:.2f}",
-            '深度(km)': f"{row['Cat_Depth']:.2f}",
-            '岛内/外海': '岛内' if row.get('Is_Inland') == True else ('外海' if row.get('Is_Inland') == False else '未知'),
-            '是否发布预警': '是' if has_eew else '否'
-        }
-        
-        if has_eew and not pd.isna(row.get('EEW_Lon')):
-            eq_info['预警经度'] = f"{row['EEW_Lon']:.4f}"
-            eq_info['预警纬度'] = f"{row['EEW_Lat']:.4f}"
-            eq_info['预警规模'] = f"{row['EEW_Mag']:.1f}"
-            eq_info['预警深度(km)'] = f"{row['EEW_Depth']:.0f}"
-            eq_info['处理时效(秒)'] = f"{row['Processing_Time']:.0f}"
-        else:
-            eq_info['预警经度'] = ''
-            eq_info['预警纬度'] = ''
-            eq_info['预警规模'] = ''
-            eq_info['预警深度(km)'] = ''
-            eq_info['处理时效(秒)'] = ''
-        
-        earthquake_list.append(eq_info)
-    
-    eq_df = pd.DataFrame(earthquake_list)
+    # Prepare detailed list with all filtered earthquakes (column-wise)
+    df = analyzer.df
+    has_eew = df['Type'].astype(str).str.contains('Y', regex=False)
+    if 'Is_Inland' in df.columns:
+        region = df['Is_Inland'].map({True: '岛内', False: '外海'}).fillna('未知')
+    else:
+        region = pd.Series('未知', index=df.index)
+    
+    def fmt(col, spec, mask=None):
+        out = df[col].map(spec.format)
+        return out if mask is None else out.where(mask, '')
+    
+    with_eew = has_eew & df['EEW_Lon'].notna()
+    eq_df = pd.DataFrame({
+        '序号': df['ID'],
+        '类型': df['Type'],
+        '发生时间': df['Origin_Time'],
+        '经度': fmt('Cat_Lon', '{:.4f}'),
+        '纬度': fmt('Cat_Lat', '{:.4f}'),
+        '规模': fmt('Cat_Mag', '{:.2f}'),
+        '深度(km)': fmt('Cat_Depth', '{:.2f}'),
+        '岛内/外海': region,
+        '是否发布预警': has_eew.map({True: '是', False: '否'}),
+        '预警经度': fmt('EEW_Lon', '{:.4f}', with_eew),
+        '预警纬度': fmt('EEW_Lat', '{:.4f}', with_eew),
+        '预警规模': fmt('EEW_Mag', '{:.1f}', with_eew),
+        '预警深度(km)': fmt('EEW_Depth', '{:.0f}', with_eew),
+        '处理时效(秒)': fmt('Processing_Time', '{:.0f}', with_eew),
+    })
     eq_df.to_csv(detail_file, index=False, encoding='utf-8-sig')
     
     print(f"\n地震详细列表已保存至: {detail_file}")
@@ -250,17 +213,19 @@ def main():
     print(f"{'ID':<6} {'Time':<16} {'Lon/Lat':<20} {'Mag':<6} {'Depth':<8} {'Region':<8} {'Alert':<6}")
     print("-"*80)
     
-    for i, eq in enumerate(earthquake_list[:20]):
-        time_str = str(eq['发生时间'])[:15] if len(str(eq['发生时间'])) > 15 else str(eq['发生时间'])
-        coord = f"{eq['经度'][:7]}/{eq['纬度'][:6]}"
-        region = eq['岛内/外海'][:4]
-        alert = eq['是否发布预警']
-        
-        print(f"{eq['序号']:<6} {time_str:<16} {coord:<20} {eq['规模']:<6} "
-              f"{eq['深度(km)']:<8} {region:<8} {alert:<6}")
-    
-    if len(earthquake_list) > 20:
-        print(f"\n... 共 {len(earthquake_list)} 笔地震记录 (Total {len(earthquake_list)} earthquakes)")
+    head = eq_df.head(20)
+    time_str = head['发生时间'].astype(str).str.slice(0, 15)
+    coord = head['经度'].str.slice(0, 7) + '/' + head['纬度'].str.slice(0, 6)
+    region = head['岛内/外海'].str.slice(0, 4)
+    
+    for eq_id, t, c, mag, depth, reg, alert in zip(
+            head['序号'], time_str, coord, head['规模'], head['深度(km)'],
+            region, head['是否发布预警']):
+        print(f"{eq_id:<6} {t:<16} {c:<20} {mag:<6} "
+              f"{depth:<8} {reg:<8} {alert:<6}")
+    
+    if len(eq_df) > 20:
+        print(f"\n... 共 {len(eq_df)} 笔地震记录 (Total {len(eq_df)} earthquakes)")
     
     print("\n完成! (Completed!)\n")
 
@@ -88,11 +88,16 @@ Examples:
     
     args = parser.parse_args()
     
-    # Check if data file exists
-    if not Path(args.data_file).exists():
+    # Resolve paths once up front
+    data_path = Path(args.data_file)
+    if not data_path.is_file():
         print(f"Error: Data file '{args.data_file}' not found!")
         sys.exit(1)
     
+    output_dir = Path(args.output_dir)
+    if args.save_csv or not args.no_plots:
+        output_dir.mkdir(parents=True, exist_ok=True)
+    
     print("\n" + "="*70)
     print("EARTHQUAKE EARLY WARNING SYSTEM (EEWS) PERFORMANCE ANALYZER")
     print("="*70)
@@ -101,7 +106,7 @@ Examples:
     
     # Initialize analyzer
     print("Loading data...")
-    analyzer = EEWSAnalyzer(args.data_file)
+    analyzer = EEWSAnalyzer(str(data_path))
     analyzer.load_data()
     print(f"Loaded {len(analyzer.df)} earthquake events")
     
@@ -126,15 +131,13 @@ Examples:
     
     # Save results to CSV if requested
     if args.save_csv:
-        output_csv = Path(args.output_dir) / "eews_analysis_results.csv"
-        Path(args.output_dir).mkdir(exist_ok=True)
-        analyzer.save_results(str(output_csv))
+        analyzer.save_results(str(output_dir / "eews_analysis_results.csv"))
     
     # Generate plots
     if not args.no_plots:
         print("\nGenerating visualizations...")
         plotter = EEWSPlotter(analyzer)
-        plotter.create_all_plots(args.output_dir)
+        plotter.create_all_plots(str(output_dir))
     
     print("\n" + "="*70)
     print("Analysis complete!")
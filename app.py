@@ -9,6 +9,7 @@ import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
 from eews_analyzer import EEWSAnalyzer
+import copy
 import os
 
 # Page configuration
@@ -93,62 +94,160 @@ with col4:
                                min_value=20.0, max_value=27.0, 
                                value=26.0, step=0.1)
 
+# Largest number of events drawn on the distribution map; beyond this the
+# browser payload (one marker plus hover record per event) gets sluggish
+MAX_MAP_POINTS = 5000
+
 # Analyze button
 analyze_button = st.sidebar.button("🔍 開始分析 / Analyze", type="primary")
 
+# Columns of the analyzed events that the plots and the table use
+PLOT_COLUMNS = ['ID', 'Origin_Time', 'Cat_Lon', 'Cat_Lat', 'Cat_Mag', 'Cat_Depth',
+                'EEW_Mag', 'Processing_Time', 'Epicenter_Error_km',
+                'Magnitude_Error', 'Is_Inland']
+
+# Legend labels of the inland/offshore groups
+INLAND_LABELS = {True: '島內 / Inland', False: '外海 / Offshore'}
+
+# Numeric figure columns; float32 is ample for plotting and halves the
+# figure payload. The table and CSV keep the analyzer's float64 values.
+FLOAT32_COLUMNS = ['Cat_Lon', 'Cat_Lat', 'Cat_Mag', 'Cat_Depth', 'EEW_Mag',
+                   'Processing_Time', 'Epicenter_Error_km', 'Magnitude_Error']
+
 # Load and cache data
+@st.cache_resource
+def load_base_analyzer(data_file):
+    """Parse a data file once per process; shared by all filter settings"""
+    analyzer = EEWSAnalyzer(data_file, boundary_file="taiwan.txt")
+    
+    # Reuse the parsed frame from a sidecar cache while it is newer than
+    # both the data file and the boundary it was classified against; the
+    # name carries the load_data version so older frames are never read
+    cache_file = f"{data_file}.v{EEWSAnalyzer.LOAD_DATA_VERSION}.pkl"
+    sources = [data_file] + [f for f in [analyzer.boundary_file] if os.path.exists(f)]
+    if (os.path.exists(cache_file) and
+            os.path.getmtime(cache_file) >= max(os.path.getmtime(f) for f in sources)):
+        try:
+            cached = pd.read_pickle(cache_file)
+        except Exception:
+            cached = None  # unreadable or foreign file; parse instead
+        # Sanity check: all data columns, and Is_Inland exactly when the
+        # boundary is available now
+        if (isinstance(cached, pd.DataFrame) and
+                set(EEWSAnalyzer.COLUMNS) <= set(cached.columns) and
+                ('Is_Inland' in cached.columns) == (len(analyzer.boundary_lons) > 0)):
+            analyzer.df = cached
+    if analyzer.df is None:
+        analyzer.load_data()
+        try:
+            analyzer.df.to_pickle(cache_file)
+        except OSError:
+            pass  # read-only deployment; just parse again next time
+    return analyzer
+
 @st.cache_data
 def load_and_analyze_data(data_file, min_mag, max_mag, max_depth, 
                           min_lon, max_lon, min_lat, max_lat):
-    """Load and analyze EEWS data"""
+    """
+    Filter the cached catalog and analyze EEWS data.
+    
+    Returns the statistics and the plotted columns as plain arrays rather
+    than the analyzer, since st.cache_data copies its result on every hit.
+    """
     if not os.path.exists(data_file):
         return None, None
     
-    # Initialize analyzer
-    analyzer = EEWSAnalyzer(data_file, boundary_file="taiwan.txt")
-    analyzer.load_data()
+    # Work on a shallow copy so the shared analyzer keeps the full catalog
+    base = load_base_analyzer(data_file)
+    analyzer = copy.copy(base)
     
     # Apply filters
-    analyzer.df = analyzer.df[
-        (analyzer.df['Cat_Mag'] >= min_mag) & 
-        (analyzer.df['Cat_Mag'] <= max_mag) &
-        (analyzer.df['Cat_Depth'] <= max_depth) &
-        (analyzer.df['Cat_Lon'] >= min_lon) & 
-        (analyzer.df['Cat_Lon'] <= max_lon) &
-        (analyzer.df['Cat_Lat'] >= min_lat) & 
-        (analyzer.df['Cat_Lat'] <= max_lat)
-    ]
+    mag = base.df['Cat_Mag'].to_numpy()
+    depth = base.df['Cat_Depth'].to_numpy()
+    lon = base.df['Cat_Lon'].to_numpy()
+    lat = base.df['Cat_Lat'].to_numpy()
+    mask = ((mag >= min_mag) & (mag <= max_mag) & (depth <= max_depth) &
+            (lon >= min_lon) & (lon <= max_lon) &
+            (lat >= min_lat) & (lat <= max_lat))
+    analyzer.df = base.df.iloc[np.flatnonzero(mask)]
+    if len(analyzer.df) == 0:
+        return {}, {'total_earthquakes': 0}
     
     # Calculate errors
-    analyzer.calculate_errors()
+    df = analyzer.calculate_errors()
     
     # Get statistics
     stats = analyzer.get_statistics()
     
-    return analyzer, stats
+    views = {col: df[col].to_numpy() for col in PLOT_COLUMNS if col in df.columns}
+    if 'Is_Inland' in df.columns:
+        views['Is_Inland_Label'] = pd.Categorical(
+            df['Is_Inland'].map(INLAND_LABELS),
+            categories=list(INLAND_LABELS.values())
+        )
+    return views, stats
+
+def histogram_by_group(values, inland, bins=30):
+    """Bin values once on shared edges and count them per inland/offshore group"""
+    valid = ~np.isnan(values)
+    edges = np.histogram_bin_edges(values[valid], bins=bins)
+    counts = {}
+    for flag, label in INLAND_LABELS.items():
+        in_group = valid & (inland == flag)
+        if in_group.any():
+            counts[label] = np.histogram(values[in_group], bins=edges)[0]
+    return edges, counts
+
+@st.cache_data
+def overlay_histogram(values, inland, title, x_label):
+    """Overlaid inland/offshore histogram, rebuilt only when its data changes"""
+    edges, counts = histogram_by_group(values, inland)
+    centers = 0.5 * (edges[:-1] + edges[1:])
+    fig = go.Figure([
+        go.Bar(x=centers, y=cnt, width=np.diff(edges), name=label, opacity=0.7)
+        for label, cnt in counts.items()
+    ])
+    fig.update_layout(
+        title=title,
+        barmode='overlay',
+        xaxis_title=x_label,
+        yaxis_title='數量 / Count',
+        legend_title_text='類型 / Type'
+    )
+    return fig
+
+@st.cache_data
+def newest_first(origin_time):
+    """Row order for the earthquake table, latest origin time first"""
+    return np.argsort(origin_time, kind='stable')[::-1]
+
+@st.cache_data
+def make_csv(df):
+    """CSV text for the download button, rebuilt only when the table changes"""
+    return df.to_csv(index=False, encoding='utf-8-sig')
 
 # Main content
-if analyze_button or 'analyzer' not in st.session_state:
+if analyze_button or 'views' not in st.session_state:
     with st.spinner('正在分析數據... / Analyzing data...'):
-        analyzer, stats = load_and_analyze_data(
+        views, stats = load_and_analyze_data(
             data_file, min_mag, max_mag, max_depth,
             min_lon, max_lon, min_lat, max_lat
         )
         
-        if analyzer is None:
+        if views is None:
             st.error(f"❌ 找不到資料檔案: {data_file}")
             st.stop()
         
-        st.session_state['analyzer'] = analyzer
+        st.session_state['views'] = views
         st.session_state['stats'] = stats
 
 # Get data from session state
-if 'analyzer' in st.session_state:
-    analyzer = st.session_state['analyzer']
+if 'views' in st.session_state:
+    views = st.session_state['views']
     stats = st.session_state['stats']
     
     # Check if data exists
-    if len(analyzer.df) == 0:
+    if stats['total_earthquakes'] == 0:
         st.warning("⚠️ 沒有符合條件的地震資料 / No earthquakes match the criteria")
         st.stop()
     
@@ -237,22 +336,24 @@ if 'analyzer' in st.session_state:
     # Interactive plots
     st.header("📊 互動式圖表 / Interactive Plots")
     
-    # Prepare data for plotting
-    df_plot = analyzer.df_analyzed.copy()
-    df_plot['Is_Inland_Label'] = df_plot['Is_Inland'].map({
-        True: '島內 / Inland', 
-        False: '外海 / Offshore'
-    })
+    # Prepare data for plotting; a read-only frame over the cached arrays
+    df_plot = pd.DataFrame(views, copy=False)
+    # Figures get a float32 copy of the numeric columns
+    df_fig = df_plot.astype({col: np.float32 for col in FLOAT32_COLUMNS
+                             if col in df_plot.columns})
     
-    # Tab layout for different plots
-    tab1, tab2, tab3, tab4 = st.tabs([
+    # View selector for the different plots; unlike st.tabs, only the
+    # selected view's figures are built and sent on each rerun
+    views_list = [
         "🗺️ 地震分布圖 / Distribution Map",
         "⏱️ 處理時效分析 / Processing Time",
         "📍 震央誤差分析 / Epicenter Error",
         "📏 規模誤差分析 / Magnitude Error"
-    ])
+    ]
+    active_view = st.radio("圖表 / View", views_list, horizontal=True,
+                           label_visibility="collapsed")
     
-    with tab1:
+    if active_view == views_list[0]:
         st.subheader("地震分布圖 / Earthquake Distribution Map")
         
         # Color by selection
@@ -276,9 +377,27 @@ if 'analyzer' in st.session_state:
             color_label = '類型 / Type'
             color_scale = None
         
+        # Keep the map payload bounded: a fixed-seed sample stratified by
+        # magnitude decile, so every magnitude range stays represented
+        df_map = df_fig
+        if len(df_fig) > MAX_MAP_POINTS:
+            mag_bin = pd.qcut(df_fig['Cat_Mag'], 10, labels=False, duplicates='drop')
+            per_bin = MAX_MAP_POINTS // mag_bin.nunique()
+            df_map = (df_fig.sample(frac=1, random_state=0)
+                      .groupby(mag_bin).head(per_bin).sort_index())
+            st.caption(f"顯示 {len(df_map)} 筆抽樣 / Showing a {len(df_map)}-event sample of {len(df_fig)} events")
+        
         # Create map
-        fig_map = px.scatter_geo(
-            df_plot,
+        # WebGL map tiles; zoom so the filter box plus a 0.5 degree margin
+        # fits the 550 px below the title. Mapbox GL's world is 512 px wide
+        # at zoom 0; latitude is measured in Mercator units, and the map is
+        # taken to be at least as wide as it is tall.
+        map_px = 600 - 50
+        merc_lat = np.radians(np.clip([min_lat - 0.5, max_lat + 0.5], -85.0, 85.0))
+        merc_y = np.degrees(np.log(np.tan(np.pi / 4 + merc_lat / 2)))
+        map_span = max(max_lon - min_lon + 1.0, merc_y[1] - merc_y[0])
+        fig_map = px.scatter_mapbox(
+            df_map,
             lat='Cat_Lat',
             lon='Cat_Lon',
             color=color_col,
@@ -302,50 +421,34 @@ if 'analyzer' in st.session_state:
                 'Is_Inland_Label': '類型 / Type'
             },
             color_continuous_scale=color_scale if color_scale else None,
-            title=f"地震分布圖 (按{color_by}著色) / Distribution Map (colored by {color_by})"
-        )
-        
-        fig_map.update_geos(
-            projection_type="mercator",
-            lataxis_range=[min_lat-0.5, max_lat+0.5],
-            lonaxis_range=[min_lon-0.5, max_lon+0.5],
-            showcountries=True,
-            showland=True,
-            landcolor="lightgray",
-            showocean=True,
-            oceancolor="lightblue"
+            title=f"地震分布圖 (按{color_by}著色) / Distribution Map (colored by {color_by})",
+            center={'lat': (min_lat + max_lat) / 2, 'lon': (min_lon + max_lon) / 2},
+            zoom=float(np.log2(map_px / map_span * 360 / 512)),
+            mapbox_style='carto-positron'
         )
         
         fig_map.update_layout(height=600, margin=dict(l=0, r=0, t=50, b=0))
         st.plotly_chart(fig_map, use_container_width=True)
     
-    with tab2:
+    if active_view == views_list[1]:
         st.subheader("處理時效分析 / Processing Time Analysis")
         
         col1, col2 = st.columns(2)
         
         with col1:
             # Histogram
-            fig_hist = px.histogram(
-                df_plot,
-                x='Processing_Time',
-                color='Is_Inland_Label',
-                nbins=30,
-                title='處理時效分布 / Processing Time Distribution',
-                labels={
-                    'Processing_Time': '處理時效 (秒) / Processing Time (s)',
-                    'count': '數量 / Count',
-                    'Is_Inland_Label': '類型 / Type'
-                },
-                barmode='overlay',
-                opacity=0.7
+            fig_hist = overlay_histogram(
+                views['Processing_Time'],
+                views['Is_Inland'],
+                '處理時效分布 / Processing Time Distribution',
+                '處理時效 (秒) / Processing Time (s)'
             )
             st.plotly_chart(fig_hist, use_container_width=True)
         
         with col2:
             # Box plot
             fig_box = px.box(
-                df_plot,
+                df_fig,
                 x='Is_Inland_Label',
                 y='Processing_Time',
                 color='Is_Inland_Label',
@@ -357,33 +460,25 @@ if 'analyzer' in st.session_state:
             )
             st.plotly_chart(fig_box, use_container_width=True)
     
-    with tab3:
+    if active_view == views_list[2]:
         st.subheader("震央誤差分析 / Epicenter Error Analysis")
         
         col1, col2 = st.columns(2)
         
         with col1:
             # Histogram
-            fig_hist = px.histogram(
-                df_plot,
-                x='Epicenter_Error_km',
-                color='Is_Inland_Label',
-                nbins=30,
-                title='震央誤差分布 / Epicenter Error Distribution',
-                labels={
-                    'Epicenter_Error_km': '震央誤差 (km) / Epicenter Error (km)',
-                    'count': '數量 / Count',
-                    'Is_Inland_Label': '類型 / Type'
-                },
-                barmode='overlay',
-                opacity=0.7
+            fig_hist = overlay_histogram(
+                views['Epicenter_Error_km'],
+                views['Is_Inland'],
+                '震央誤差分布 / Epicenter Error Distribution',
+                '震央誤差 (km) / Epicenter Error (km)'
             )
             st.plotly_chart(fig_hist, use_container_width=True)
         
         with col2:
             # Scatter plot
             fig_scatter = px.scatter(
-                df_plot,
+                df_fig,
                 x='Cat_Mag',
                 y='Epicenter_Error_km',
                 color='Is_Inland_Label',
@@ -399,33 +494,25 @@ if 'analyzer' in st.session_state:
             )
             st.plotly_chart(fig_scatter, use_container_width=True)
     
-    with tab4:
+    if active_view == views_list[3]:
         st.subheader("規模誤差分析 / Magnitude Error Analysis")
         
         col1, col2 = st.columns(2)
         
         with col1:
             # Histogram
-            fig_hist = px.histogram(
-                df_plot,
-                x='Magnitude_Error',
-                color='Is_Inland_Label',
-                nbins=30,
-                title='規模誤差分布 / Magnitude Error Distribution',
-                labels={
-                    'Magnitude_Error': '規模誤差 / Magnitude Error',
-                    'count': '數量 / Count',
-                    'Is_Inland_Label': '類型 / Type'
-                },
-                barmode='overlay',
-                opacity=0.7
+            fig_hist = overlay_histogram(
+                views['Magnitude_Error'],
+                views['Is_Inland'],
+                '規模誤差分布 / Magnitude Error Distribution',
+                '規模誤差 / Magnitude Error'
             )
             st.plotly_chart(fig_hist, use_container_width=True)
         
         with col2:
             # Scatter plot: Catalog vs EEW magnitude
             fig_scatter = px.scatter(
-                df_plot,
+                df_fig,
                 x='Cat_Mag',
                 y='EEW_Mag',
                 color='Is_Inland_Label',
@@ -464,13 +551,13 @@ if 'analyzer' in st.session_state:
     
     # Display data
     st.dataframe(
-        df_plot[available_cols].sort_values('Origin_Time', ascending=False),
+        df_plot[available_cols].iloc[newest_first(views['Origin_Time'])],
         use_container_width=True,
         height=400
     )
     
     # Download button
-    csv = df_plot[available_cols].to_csv(index=False, encoding='utf-8-sig')
+    csv = make_csv(df_plot[available_cols])
     st.download_button(
         label="📥 下載 CSV / Download CSV",
         data=csv,
@@ -16,14 +16,69 @@ Examples:
 import numpy as np
 import pandas as pd
 from datetime import datetime
-import math
+import functools
+import os
 import sys
 from typing import Tuple, Dict, List
 
+try:
+    from scipy.spatial import cKDTree
+    HAS_SCIPY = True
+except ImportError:
+    HAS_SCIPY = False
+
+
+def _describe(values: np.ndarray) -> Dict[str, float]:
+    """
+    mean/std/median/max/min of the non-NaN values, matching the pandas
+    Series reductions: NaN (without warnings) when there are no values, and
+    a NaN std (ddof=1) for a single value.
+    """
+    v = np.asarray(values, dtype=np.float64)
+    v = v[~np.isnan(v)]
+    if v.size == 0:
+        return dict.fromkeys(('mean', 'std', 'median', 'max', 'min'), np.nan)
+    return {
+        'mean': v.mean(),
+        'std': v.std(ddof=1) if v.size > 1 else np.nan,
+        'median': np.median(v),
+        'max': v.max(),
+        'min': v.min(),
+    }
+
+
+@functools.lru_cache(maxsize=8)
+def _read_boundary(path: str, mtime: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Read boundary (lon, lat) columns as two contiguous float64 arrays.
+    
+    Cached per path and modification time so repeated analyzers share one
+    parse; the arrays are read-only because they are shared.
+    """
+    coords = np.loadtxt(path, usecols=(0, 1), ndmin=2)
+    lons = np.ascontiguousarray(coords[:, 0])
+    lats = np.ascontiguousarray(coords[:, 1])
+    lons.flags.writeable = False
+    lats.flags.writeable = False
+    return lons, lats
+
 
 class EEWSAnalyzer:
     """Analyzes EEWS performance data"""
     
+    # Whitespace-separated columns of the data file; N/L rows stop after Cat_Depth
+    COLUMNS = ['Type', 'ID', 'Origin_Time', 'Cat_Lon', 'Cat_Lat', 'Cat_Mag', 'Cat_Depth',
+               'EEW_Lon', 'EEW_Lat', 'EEW_Mag', 'EEW_Depth', 'Processing_Time']
+    EEW_COLUMNS = ['EEW_Lon', 'EEW_Lat', 'EEW_Mag', 'EEW_Depth', 'Processing_Time']
+    
+    # Events per block in classify_inland
+    INLAND_BLOCK_SIZE = 2048
+    
+    # Version of the frame load_data builds (columns, dtypes, Is_Inland
+    # rule); bump it whenever that output changes so on-disk caches of it
+    # (app.py) are rebuilt
+    LOAD_DATA_VERSION = 1
+    
     def __init__(self, data_file: str, boundary_file: str = "taiwan.txt"):
         """
         Initialize analyzer with data file.
@@ -36,8 +91,12 @@ class EEWSAnalyzer:
         self.boundary_file = boundary_file
         self.df = None
         self.results = {}
-        self.boundary_lons = []
-        self.boundary_lats = []
+        self._masks_df = None  # frame the cached Type masks belong to
+        self._stats_source = (None, None)  # (df, df_analyzed) behind self.results
+        self.boundary_lons = np.empty(0)
+        self.boundary_lats = np.empty(0)
+        self._bbox = None  # (lon_min, lon_max, lat_min, lat_max) of the boundary
+        self._coast_tree = None  # KD-tree over boundary points (scipy optional)
         self.near_coast_line_dis = 1.0  # km
         
         # Load boundary data if file exists
@@ -46,22 +105,103 @@ class EEWSAnalyzer:
     def _load_boundary_data(self):
         """Load Taiwan boundary coordinates from file"""
         try:
-            with open(self.boundary_file, 'r') as f:
-                for line in f:
-                    data = line.split()
-                    if len(data) >= 2:
-                        self.boundary_lons.append(float(data[0]))
-                        self.boundary_lats.append(float(data[1]))
+            self.boundary_lons, self.boundary_lats = _read_boundary(
+                self.boundary_file, os.path.getmtime(self.boundary_file))
+            if len(self.boundary_lons) > 0:
+                self._bbox = (self.boundary_lons.min(), self.boundary_lons.max(),
+                              self.boundary_lats.min(), self.boundary_lats.max())
+                self._coast_center = (self.boundary_lons.mean(), self.boundary_lats.mean())
+                if HAS_SCIPY:
+                    self._coast_tree = cKDTree(self._coast_xy(self.boundary_lons, self.boundary_lats))
         except FileNotFoundError:
             print(f"Warning: Boundary file '{self.boundary_file}' not found. Inland/offshore analysis will be skipped.")
     
+    def _coast_xy(self, lons, lats) -> np.ndarray:
+        """
+        Planar km coordinates around the boundary centre, using the
+        calculate_distance scale factors at the centre latitude.
+        """
+        lon0, avlat = self._coast_center
+        a = 1.840708 + avlat * (0.0015269 + avlat * (-0.00034 + avlat * 1.02337e-6))
+        b = 1.843404 + avlat * (-6.93799e-5 + avlat * (8.79993e-6 + avlat * (-6.47527e-8)))
+        return np.column_stack([a * (lons - lon0) * 60.0, b * (lats - avlat) * 60.0])
+    
+    def _near_coast(self, lons: np.ndarray, lats: np.ndarray) -> np.ndarray:
+        """
+        True where a location is within near_coast_line_dis km of a boundary
+        point, using the KD-tree to pick candidate points.
+        """
+        r = self.near_coast_line_dis
+        # The projection is off by a few percent away from the centre
+        # latitude, so (event, boundary point) candidate pairs are gathered
+        # with a margin and all confirmed with one calculate_distance call
+        events = cKDTree(self._coast_xy(lons, lats))
+        pairs = events.sparse_distance_matrix(self._coast_tree, r * 1.1, output_type='ndarray')
+        i, j = pairs['i'], pairs['j']
+        close = self.calculate_distance(lats[i], lons[i],
+                                        self.boundary_lats[j], self.boundary_lons[j]) < r
+        near = np.zeros(len(lons), dtype=bool)
+        near[i[close]] = True
+        return near
+    
+    def classify_inland(self, lons, lats) -> np.ndarray:
+        """
+        Classify many earthquake locations as inland or offshore at once.
+        
+        A location is inland if it lies inside the boundary polygon (even-odd
+        ray casting against every boundary edge) or within near_coast_line_dis
+        km of a boundary point, matching ana_forplot.py check_seis_r.
+        
+        Args:
+            lons: Longitudes of earthquakes (array-like)
+            lats: Latitudes of earthquakes (array-like)
+            
+        Returns:
+            Boolean array, True where inland
+        """
+        # Re-reported epicenters are classified once and mapped back
+        points, inverse = np.unique(
+            np.column_stack([np.asarray(lons, dtype=float), np.asarray(lats, dtype=float)]),
+            axis=0, return_inverse=True
+        )
+        inland = np.zeros(len(points), dtype=bool)
+        if self._bbox is None:
+            return inland[inverse.reshape(-1)]
+        
+        # Only points inside the boundary box padded by near_coast_line_dis
+        # can be inland (1 km < 0.01 deg at Taiwan latitudes)
+        pad = self.near_coast_line_dis / 100.0
+        lon_min, lon_max, lat_min, lat_max = self._bbox
+        in_box = ((points[:, 0] >= lon_min - pad) & (points[:, 0] <= lon_max + pad) &
+                  (points[:, 1] >= lat_min - pad) & (points[:, 1] <= lat_max + pad))
+        box_idx = np.flatnonzero(in_box)
+        lons = points[box_idx, 0]
+        lats = points[box_idx, 1]
+        vx = self.boundary_lons
+        vy = self.boundary_lats
+        # Edge i runs from vertex i to vertex i+1; the closing edge is
+        # degenerate (and never crossed) when the ring is already closed
+        vx2 = np.roll(vx, -1)
+        vy2 = np.roll(vy, -1)
+        
+        # Evaluate in blocks of events to bound the (events x edges) temporaries
+        for start in range(0, len(lons), self.INLAND_BLOCK_SIZE):
+            px = lons[start:start + self.INLAND_BLOCK_SIZE, None]
+            py = lats[start:start + self.INLAND_BLOCK_SIZE, None]
+            with np.errstate(divide='ignore', invalid='ignore'):
+                crossing = ((vy > py) != (vy2 > py)) & (
+                    px < (vx2 - vx) * (py - vy) / (vy2 - vy) + vx)
+            inside = np.logical_xor.reduce(crossing, axis=1)
+            if self._coast_tree is not None:
+                near = self._near_coast(px[:, 0], py[:, 0])
+            else:
+                near = (self.calculate_distance(py, px, vy, vx) < self.near_coast_line_dis).any(axis=1)
+            inland[box_idx[start:start + len(px)]] = inside | near
+        return inland[inverse.reshape(-1)]
+    
     def check_inland(self, lon: float, lat: float) -> bool:
         """
         Check if earthquake location is inland (within Taiwan boundary).
-        Uses the same algorithm as ana_forplot.py check_seis_r function.
-        
-        The algorithm checks if the earthquake location is surrounded by boundary points
-        in all four quadrants, or if it's very close to any boundary point.
         
         Args:
             lon: Longitude of earthquake
@@ -70,101 +210,86 @@ class EEWSAnalyzer:
         Returns:
             True if inland, False if offshore
         """
-        if not self.boundary_lons:
+        if len(self.boundary_lons) == 0:
             return None  # No boundary data available
         
-        # Following ana_forplot.py logic: accumulate quadrant information
-        # across all boundary points
-        sta = [0, 0, 0, 0, 0]
-        result = 0
-        
-        for i in range(len(self.boundary_lons)):
-            x = self.boundary_lons[i] - lon
-            y = self.boundary_lats[i] - lat
-            dist = self.calculate_distance(lat, lon, self.boundary_lats[i], self.boundary_lons[i])
-            
-            # Check and accumulate quadrants (cumulative across all boundary points)
-            if x > 0 and y > 0:
-                sta[0] = 1
-            if x < 0 and y < 0:
-                sta[1] = 1
-            if x > 0 and y < 0:
-                sta[2] = 1
-            if x < 0 and y > 0:
-                sta[3] = 1
-            if dist < self.near_coast_line_dis:
-                sta[4] = 1
-            
-            # Check if all quadrants are covered or very close to any boundary point
-            check = sta[0] * sta[1] * sta[2] * sta[3]
-            
-            if check == 1 or sta[4] == 1:
-                result = 1
-                break
-        
-        return result == 1
+        return bool(self.classify_inland([lon], [lat])[0])
         
     def load_data(self) -> pd.DataFrame:
         """Load and parse the EEWS data file"""
-        # Read the data file
-        data = []
+        # Parse the whole file with the C reader; the header line is skipped,
+        # blank lines are dropped and any fields past the 12th are ignored
+        df = pd.read_csv(
+            self.data_file, sep=r'\s+', header=None, skiprows=1,
+            names=self.COLUMNS, usecols=range(len(self.COLUMNS)),
+            dtype={col: (str if col in ('Type', 'ID', 'Origin_Time') else np.float64)
+                   for col in self.COLUMNS},
+            encoding='utf-8'
+        )
         
-        with open(self.data_file, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-            
-        # Skip header
-        for line in lines[1:]:
-            if line.strip():
-                parts = line.split()
-                if len(parts) >= 7:  # At least catalog data
-                    row = {
-                        'Type': parts[0],
-                        'ID': parts[1],
-                        'Origin_Time': parts[2],
-                        'Cat_Lon': float(parts[3]),
-                        'Cat_Lat': float(parts[4]),
-                        'Cat_Mag': float(parts[5]),
-                        'Cat_Depth': float(parts[6])
-                    }
-                    
-                    # Add EEW data if available (Type contains 'Y')
-                    if 'Y' in parts[0] and len(parts) >= 12:
-                        row['EEW_Lon'] = float(parts[7])
-                        row['EEW_Lat'] = float(parts[8])
-                        row['EEW_Mag'] = float(parts[9])
-                        row['EEW_Depth'] = float(parts[10])
-                        row['Processing_Time'] = float(parts[11])
-                    else:
-                        row['EEW_Lon'] = np.nan
-                        row['EEW_Lat'] = np.nan
-                        row['EEW_Mag'] = np.nan
-                        row['EEW_Depth'] = np.nan
-                        row['Processing_Time'] = np.nan
-                    
-                    data.append(row)
-        
-        self.df = pd.DataFrame(data)
+        # Rows need at least the catalog data
+        df = df[df['Cat_Depth'].notna()].reset_index(drop=True)
+        
+        # EEW data only counts for complete rows whose Type contains 'Y'
+        has_eew = df['Type'].str.contains('Y', regex=False) & df['Processing_Time'].notna()
+        df.loc[~has_eew, self.EEW_COLUMNS] = np.nan
+        
+        # Only a handful of distinct type codes (xY/xN/xL)
+        df['Type'] = df['Type'].astype('category')
+        
+        self.df = df
         
         # Add inland/offshore classification
-        if self.boundary_lons:
-            self.df['Is_Inland'] = self.df.apply(
-                lambda row: self.check_inland(row['Cat_Lon'], row['Cat_Lat']),
-                axis=1
-            )
+        if len(self.boundary_lons) > 0:
+            self.df['Is_Inland'] = self.classify_inland(self.df['Cat_Lon'], self.df['Cat_Lat'])
         
         return self.df
     
+    def _type_masks(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Boolean detected ('Y') and missed ('N'/'L') masks over self.df.
+        
+        Computed once per DataFrame and reused until self.df is replaced
+        (e.g. by filtering).
+        """
+        if self._masks_df is not self.df:
+            types = self.df['Type']
+            if isinstance(types.dtype, pd.CategoricalDtype):
+                # Match the few category labels, then select rows by code
+                categories = types.cat.categories
+                codes = types.cat.codes.to_numpy()
+                self._mask_detected = np.isin(codes, np.flatnonzero(categories.str.contains('Y')))
+                self._mask_missed = np.isin(codes, np.flatnonzero(categories.str.contains('N|L')))
+            else:
+                self._mask_detected = types.str.contains('Y', na=False).to_numpy()
+                self._mask_missed = types.str.contains('N|L', na=False).to_numpy()
+            self._masks_df = self.df
+        return self._mask_detected, self._mask_missed
+    
+    @staticmethod
+    def parse_origin_time(origin_time: pd.Series) -> pd.Series:
+        """
+        Convert Origin_Time strings (YYYYMMDDHHMMSS plus a tenths digit) to
+        datetime64 with an explicit format, so pandas takes its vectorized
+        parser instead of guessing per element. Unparseable values give NaT.
+        """
+        return pd.to_datetime(origin_time.str[:14], format='%Y%m%d%H%M%S',
+                              errors='coerce', cache=True)
+    
     @staticmethod
-    def calculate_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    def calculate_distance(lat1, lon1, lat2, lon2):
         """
         Calculate epicentral distance in km using simplified method.
         
+        Accepts scalars or NumPy arrays (broadcast elementwise); NaN
+        coordinates give NaN distances.
+        
         Args:
             lat1, lon1: First point coordinates
             lat2, lon2: Second point coordinates
             
         Returns:
-            Distance in km
+            Distance in km (float or ndarray)
         """
         avlat = 0.5 * (lat1 + lat2)
         a = 1.840708 + avlat * (0.0015269 + avlat * (-0.00034 + avlat * 1.02337e-6))
@@ -173,24 +298,36 @@ class EEWSAnalyzer:
         dlon = lon2 - lon1
         dx = a * dlon * 60.0
         dy = b * dlat * 60.0
-        delta = math.sqrt(dx * dx + dy * dy)
+        delta = np.sqrt(dx * dx + dy * dy)
         return delta
     
+    @staticmethod
+    def rms(values) -> float:
+        """
+        Root-mean-square of the non-NaN values (NaN if there are none).
+        
+        The sum of squares is a single dot-product reduction, so no squared
+        temporary array is allocated.
+        """
+        e = np.asarray(values, dtype=np.float64)
+        e = e[~np.isnan(e)]
+        if e.size == 0:
+            return np.nan
+        return np.sqrt(np.einsum('i,i->', e, e) / e.size)
+    
     def calculate_errors(self) -> pd.DataFrame:
         """Calculate all error metrics"""
         if self.df is None:
             self.load_data()
         
         # Filter for successful EEW detections (Type contains 'Y')
-        eew_detected = self.df[self.df['Type'].str.contains('Y', na=False)].copy()
+        eew_detected = self.df[self._type_masks()[0]].copy()
         
         # Calculate epicenter error
-        eew_detected['Epicenter_Error_km'] = eew_detected.apply(
-            lambda row: self.calculate_distance(
-                row['Cat_Lat'], row['Cat_Lon'],
-                row['EEW_Lat'], row['EEW_Lon']
-            ) if not np.isnan(row['EEW_Lat']) else np.nan,
-            axis=1
+        # (column-wise; NaN EEW coordinates give NaN errors)
+        eew_detected['Epicenter_Error_km'] = self.calculate_distance(
+            eew_detected['Cat_Lat'].to_numpy(), eew_detected['Cat_Lon'].to_numpy(),
+            eew_detected['EEW_Lat'].to_numpy(), eew_detected['EEW_Lon'].to_numpy()
         )
         
         # Calculate magnitude error
@@ -211,8 +348,21 @@ class EEWSAnalyzer:
         if not hasattr(self, 'df_analyzed'):
             self.calculate_errors()
         
+        # Same data as the last call: the cached results still hold
+        source_df, source_analyzed = self._stats_source
+        if self.results and source_df is self.df and source_analyzed is self.df_analyzed:
+            return self.results
+        
         df = self.df_analyzed.dropna(subset=['Epicenter_Error_km'])
         
+        # Raw column arrays, each reduced once; _describe matches the
+        # pandas reductions, including NaN results for empty selections
+        ep = _describe(df['Epicenter_Error_km'].to_numpy())
+        mag_values = df['Magnitude_Error'].to_numpy()
+        mag = _describe(mag_values)
+        dep = _describe(df['Depth_Error_km'].to_numpy())
+        pt = _describe(df['Processing_Time'].to_numpy())
+        
         stats = {
             'total_earthquakes': len(self.df),
             'eew_detected': len(df),
@@ -220,54 +370,51 @@ class EEWSAnalyzer:
             'detection_rate': len(df) / len(self.df) * 100,
             
             # Epicenter error statistics
-            'epicenter_error_mean_km': df['Epicenter_Error_km'].mean(),
-            'epicenter_error_std_km': df['Epicenter_Error_km'].std(),
-            'epicenter_error_median_km': df['Epicenter_Error_km'].median(),
-            'epicenter_error_max_km': df['Epicenter_Error_km'].max(),
-            'epicenter_error_min_km': df['Epicenter_Error_km'].min(),
+            'epicenter_error_mean_km': ep['mean'],
+            'epicenter_error_std_km': ep['std'],
+            'epicenter_error_median_km': ep['median'],
+            'epicenter_error_max_km': ep['max'],
+            'epicenter_error_min_km': ep['min'],
             
             # Magnitude error statistics
-            'magnitude_error_mean': df['Magnitude_Error'].mean(),
-            'magnitude_error_std': df['Magnitude_Error'].std(),
-            'magnitude_error_rms': np.sqrt(np.mean(df['Magnitude_Error']**2)),
+            'magnitude_error_mean': mag['mean'],
+            'magnitude_error_std': mag['std'],
+            'magnitude_error_rms': self.rms(mag_values),
             
             # Depth error statistics
-            'depth_error_mean_km': df['Depth_Error_km'].mean(),
-            'depth_error_std_km': df['Depth_Error_km'].std(),
+            'depth_error_mean_km': dep['mean'],
+            'depth_error_std_km': dep['std'],
             
             # Processing time statistics
-            'processing_time_mean_s': df['Processing_Time'].mean(),
-            'processing_time_std_s': df['Processing_Time'].std(),
-            'processing_time_median_s': df['Processing_Time'].median(),
-            'processing_time_max_s': df['Processing_Time'].max(),
-            'processing_time_min_s': df['Processing_Time'].min(),
+            'processing_time_mean_s': pt['mean'],
+            'processing_time_std_s': pt['std'],
+            'processing_time_median_s': pt['median'],
+            'processing_time_max_s': pt['max'],
+            'processing_time_min_s': pt['min'],
         }
         
         # Add inland/offshore statistics if available
         if 'Is_Inland' in df.columns and df['Is_Inland'].notna().any():
-            df_inland = df[df['Is_Inland'] == True]
-            df_offshore = df[df['Is_Inland'] == False]
+            # One grouped pass yields the inland (True) and offshore (False) rows
+            grouped = df.groupby('Is_Inland', sort=False)
+            agg = grouped[['Epicenter_Error_km', 'Processing_Time']].agg(['mean', 'std'])
+            mag_rms = grouped['Magnitude_Error'].agg(self.rms)
+            counts = grouped.size()
             
-            stats['inland_count'] = len(df_inland)
-            stats['offshore_count'] = len(df_offshore)
+            stats['inland_count'] = int(counts.get(True, 0))
+            stats['offshore_count'] = int(counts.get(False, 0))
             
-            # Inland statistics
-            if len(df_inland) > 0:
-                stats['inland_epicenter_error_mean_km'] = df_inland['Epicenter_Error_km'].mean()
-                stats['inland_epicenter_error_std_km'] = df_inland['Epicenter_Error_km'].std()
-                stats['inland_magnitude_error_rms'] = np.sqrt(np.mean(df_inland['Magnitude_Error']**2))
-                stats['inland_processing_time_mean_s'] = df_inland['Processing_Time'].mean()
-                stats['inland_processing_time_std_s'] = df_inland['Processing_Time'].std()
-            
-            # Offshore statistics
-            if len(df_offshore) > 0:
-                stats['offshore_epicenter_error_mean_km'] = df_offshore['Epicenter_Error_km'].mean()
-                stats['offshore_epicenter_error_std_km'] = df_offshore['Epicenter_Error_km'].std()
-                stats['offshore_magnitude_error_rms'] = np.sqrt(np.mean(df_offshore['Magnitude_Error']**2))
-                stats['offshore_processing_time_mean_s'] = df_offshore['Processing_Time'].mean()
-                stats['offshore_processing_time_std_s'] = df_offshore['Processing_Time'].std()
+            for prefix, flag in (('inland', True), ('offshore', False)):
+                if counts.get(flag, 0) > 0:
+                    row = agg.loc[flag]
+                    stats[f'{prefix}_epicenter_error_mean_km'] = row[('Epicenter_Error_km', 'mean')]
+                    stats[f'{prefix}_epicenter_error_std_km'] = row[('Epicenter_Error_km', 'std')]
+                    stats[f'{prefix}_magnitude_error_rms'] = mag_rms[flag]
+                    stats[f'{prefix}_processing_time_mean_s'] = row[('Processing_Time', 'mean')]
+                    stats[f'{prefix}_processing_time_std_s'] = row[('Processing_Time', 'std')]
         
         self.results = stats
+        self._stats_source = (self.df, self.df_analyzed)
         return stats
     
     def filter_by_magnitude(self, min_mag: float = 4.0, max_mag: float = 10.0) -> pd.DataFrame:
@@ -287,22 +434,42 @@ class EEWSAnalyzer:
         """Filter events by geographic region"""
         if self.df is None:
             self.load_data()
-        return self.df[
-            (self.df['Cat_Lon'] >= lon_range[0]) & (self.df['Cat_Lon'] <= lon_range[1]) &
-            (self.df['Cat_Lat'] >= lat_range[0]) & (self.df['Cat_Lat'] <= lat_range[1])
-        ]
+        # One boolean ndarray built in place over the raw columns
+        lon = self.df['Cat_Lon'].to_numpy()
+        lat = self.df['Cat_Lat'].to_numpy()
+        mask = lon >= lon_range[0]
+        mask &= lon <= lon_range[1]
+        mask &= lat >= lat_range[0]
+        mask &= lat <= lat_range[1]
+        return self.df[mask]
+    
+    def filter_events(self, target_year: int, min_mag: float, max_depth: float) -> pd.DataFrame:
+        """
+        Filter events of one year by minimum magnitude and maximum depth.
+        
+        Converts a raw Origin_Time column to datetime in place first, then
+        applies all three conditions as one mask over the column arrays.
+        """
+        if self.df is None:
+            self.load_data()
+        if not pd.api.types.is_datetime64_any_dtype(self.df['Origin_Time']):
+            self.df['Origin_Time'] = self.parse_origin_time(self.df['Origin_Time'])
+        keep = self.df['Origin_Time'].dt.year.to_numpy() == target_year
+        keep &= self.df['Cat_Mag'].to_numpy() >= min_mag
+        keep &= self.df['Cat_Depth'].to_numpy() <= max_depth
+        return self.df[keep]
     
     def get_missed_events(self) -> pd.DataFrame:
         """Get events that were missed by EEWS"""
         if self.df is None:
             self.load_data()
-        return self.df[self.df['Type'].str.contains('N|L', na=False)]
+        return self.df[self._type_masks()[1]]
     
     def get_detected_events(self) -> pd.DataFrame:
         """Get events that were detected by EEWS"""
         if self.df is None:
             self.load_data()
-        return self.df[self.df['Type'].str.contains('Y', na=False)]
+        return self.df[self._type_masks()[0]]
     
     def print_summary(self):
         """Print a summary of the analysis"""
@@ -361,15 +528,27 @@ class EEWSAnalyzer:
         print("\n" + "="*70 + "\n")
     
     def save_results(self, output_file: str = "outputs/eews_analysis_results.csv"):
-        """Save analyzed data to CSV"""
+        """
+        Save analyzed data.
+        
+        The format follows the file extension: .feather or .parquet (binary,
+        columnar; needs pyarrow), .pkl (pickle) or anything else for CSV.
+        """
         if not hasattr(self, 'df_analyzed'):
             self.calculate_errors()
         
         # Ensure outputs directory exists
-        import os
         os.makedirs("outputs", exist_ok=True)
         
-        self.df_analyzed.to_csv(output_file, index=False)
+        ext = os.path.splitext(output_file)[1].lower()
+        if ext == '.feather':
+            self.df_analyzed.reset_index(drop=True).to_feather(output_file)
+        elif ext == '.parquet':
+            self.df_analyzed.to_parquet(output_file, index=False)
+        elif ext == '.pkl':
+            self.df_analyzed.to_pickle(output_file)
+        else:
+            self.df_analyzed.to_csv(output_file, index=False)
         print(f"Results saved to: {output_file}")
 
 
@@ -400,7 +579,6 @@ if __name__ == "__main__":
             data_file = data_file_input if data_file_input else "EEW_ALL-2014-2025.txt"
             
             # Check if file exists
-            import os
             if not os.path.exists(data_file):
                 print(f"Warning: File '{data_file}' not found. Please check the filename.")
                 retry = input("Try again? (y/n): ").strip().lower()
@@ -459,12 +637,7 @@ if __name__ == "__main__":
     
     # Apply filters
     original_count = len(analyzer.df)
-    analyzer.df['Origin_Time'] = pd.to_datetime(analyzer.df['Origin_Time'], errors='coerce')
-    analyzer.df = analyzer.df[analyzer.df['Origin_Time'].dt.year == target_year]
-    analyzer.df = analyzer.df[
-        (analyzer.df['Cat_Mag'] >= min_mag) & 
-        (analyzer.df['Cat_Depth'] <= max_depth)
-    ]
+    analyzer.df = analyzer.filter_events(target_year, min_mag, max_depth)
     filtered_count = len(analyzer.df)
     
     if filtered_count == 0:
@@ -12,14 +12,62 @@ except (ImportError, Exception) as e:
 
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+import os
+import pickle
+import shutil
+import tempfile
+import weakref
 import matplotlib.patches as mpatches
+from matplotlib.collections import LineCollection
+
+
+# Simplified Taiwan coastline (approximate outline) for the matplotlib fallback
+_TAIWAN_COAST_LON = np.array([
+    120.0, 120.1, 120.3, 120.5, 120.7, 121.0, 121.3, 121.6, 121.9, 122.0,
+    121.95, 121.9, 121.8, 121.7, 121.6, 121.5, 121.4, 121.3, 121.2, 121.1,
+    121.0, 120.9, 120.8, 120.7, 120.6, 120.5, 120.4, 120.3, 120.2, 120.1, 120.0
+])
+_TAIWAN_COAST_LAT = np.array([
+    22.0, 22.5, 23.0, 23.5, 24.0, 24.5, 24.8, 25.0, 25.2, 25.3,
+    25.2, 25.0, 24.8, 24.5, 24.2, 24.0, 23.7, 23.4, 23.1, 22.8,
+    22.5, 22.3, 22.1, 22.0, 21.9, 21.9, 21.9, 22.0, 22.0, 22.0, 22.0
+])
+
+
+def _render_plot(plotter, method_name: str, output_file: str):
+    """Run one plot method; module-level so worker processes can unpickle it"""
+    getattr(plotter, method_name)(output_file)
+
+
+def _hist_bars(ax, values: np.ndarray, bins: int = 20, **kwargs):
+    """Bin with np.histogram and draw the counts as edge-aligned bars"""
+    counts, edges = np.histogram(values, bins=bins)
+    return ax.bar(edges[:-1], counts, width=np.diff(edges), align='edge', **kwargs)
 
 
 class EEWSPlotter:
     """Create visualizations for EEWS performance analysis"""
     
+    # Above this many events the matplotlib per-event artists are rasterized
+    RASTERIZE_MIN_POINTS = 5000
+    
+    # zlib level for matplotlib PNGs: 1 encodes about twice as fast as the
+    # default 6 but files grow 10-75%; set 9 for the smallest final figures
+    PNG_COMPRESS_LEVEL = 1
+    
+    # (method, output file, description) for create_all_plots
+    ALL_PLOTS = [
+        ("plot_epicenter_errors", "epicenter_error_map.png", "epicenter error map"),
+        ("plot_magnitude_comparison", "magnitude_comparison.png", "magnitude comparison"),
+        ("plot_processing_time_map", "processing_time_map.png", "processing time map"),
+        ("plot_missed_events", "missed_events_map.png", "missed events map"),
+        ("plot_processing_time_histogram", "processing_time_hist.png", "processing time histogram"),
+        ("plot_error_distributions", "error_distributions.png", "error distributions"),
+    ]
+    
     def __init__(self, analyzer, city_boundary_file: str = "city_2016.gmt"):
         """
         Initialize plotter with an EEWSAnalyzer instance.
@@ -32,70 +80,186 @@ class EEWSPlotter:
         self.taiwan_region = [119.85, 123.1, 21.2, 25.7]  # [lon_min, lon_max, lat_min, lat_max]
         self.city_boundary_file = city_boundary_file
         
+        # dropna views of df_analyzed, keyed by subset; reset when the
+        # analyzer's df_analyzed is replaced
+        self._dropna_cache = {}
+        self._dropna_source = None
+        
+        # Legend spec and CPT files live in a private temp directory (removed
+        # with the plotter); legends are only rewritten when their text
+        # changes and CPTs are reused per (cmap, series, reverse)
+        self._temp_dir = None
+        self._legend_text = {}
+        self._cpt_cache = {}
+    
+    def __getstate__(self):
+        """
+        Pickled state for create_all_plots' worker processes: the temp
+        directory is shared, but the record of files written there is not,
+        so each worker writes its own CPT and legend files.
+        """
+        state = self.__dict__.copy()
+        state['_legend_text'] = {}
+        state['_cpt_cache'] = {}
+        return state
+    
+    def _ensure_temp_dir(self) -> str:
+        """Create the plotter's temp directory on first use"""
+        if self._temp_dir is None:
+            self._temp_dir = tempfile.mkdtemp(prefix="eews_plot_")
+            weakref.finalize(self, shutil.rmtree, self._temp_dir, ignore_errors=True)
+        return self._temp_dir
+    
+    def _save_matplotlib(self, fig: Figure, output_file: str, dpi: int):
+        """Save a matplotlib figure, using PNG_COMPRESS_LEVEL for PNGs"""
+        kwargs = {}
+        if Path(output_file).suffix.lower() == ".png":
+            kwargs["pil_kwargs"] = {"compress_level": self.PNG_COMPRESS_LEVEL}
+        fig.savefig(output_file, dpi=dpi, bbox_inches='tight', **kwargs)
+    
+    def _legend_file(self, name: str, text: str) -> str:
+        """Return the path of a GMT legend spec file holding text"""
+        path = Path(self._ensure_temp_dir()) / name
+        if self._legend_text.get(name) != text:
+            path.write_text(text)
+            self._legend_text[name] = text
+        return str(path)
+    
+    def _cpt(self, cmap: str, series, reverse: bool = False) -> str:
+        """
+        Path of a CPT file for cmap over series, made by pygmt.makecpt only
+        the first time a given (cmap, series, reverse) is requested.
+        """
+        key = (cmap, float(series[0]), float(series[1]), reverse)
+        if key not in self._cpt_cache:
+            # The temp directory is shared with create_all_plots' worker
+            # processes, so file names carry the process id
+            name = f"cpt_{os.getpid()}_{len(self._cpt_cache)}.cpt"
+            path = str(Path(self._ensure_temp_dir()) / name)
+            pygmt.makecpt(cmap=cmap, series=[key[1], key[2]], reverse=reverse, output=path)
+            self._cpt_cache[key] = path
+        return self._cpt_cache[key]
+    
+    def _ensure_analyzed(self) -> pd.DataFrame:
+        """The analyzer's df_analyzed, running calculate_errors on first use"""
+        df_all = getattr(self.analyzer, 'df_analyzed', None)
+        if df_all is None:
+            df_all = self.analyzer.calculate_errors()
+        return df_all
+    
+    def _analyzed(self, subset=None) -> pd.DataFrame:
+        """
+        Analyzed events without NaN in the subset columns (any column if None).
+        
+        Computed once per subset and shared by the plot methods.
+        """
+        df_all = self._ensure_analyzed()
+        if self._dropna_source is not df_all:
+            self._dropna_cache = {}
+            self._dropna_source = df_all
+        
+        key = None if subset is None else tuple(sorted(subset))
+        if key not in self._dropna_cache:
+            self._dropna_cache[key] = df_all.dropna(subset=subset)
+        return self._dropna_cache[key]
+    
+    def _taiwan_base_map(self, city_pen: str = "0.5p,black"):
+        """
+        New PyGMT figure with the Taiwan basemap, coastline and city
+        boundaries drawn, shared by the map plots.
+        """
+        fig = pygmt.Figure()
+        
+        # Setup map projection and region
+        region = self.taiwan_region
+        projection = "M15c"
+        
+        fig.basemap(region=region, projection=projection, frame=["af", "WSne"])
+        fig.coast(region=region, projection=projection,
+                  land="lightgray", water="lightblue",
+                  shorelines="1/0.5p,black")
+        
+        # Draw city boundaries from GMT file
+        try:
+            fig.plot(self.city_boundary_file, pen=city_pen)
+        except Exception as e:
+            print(f"Warning: Could not plot city boundaries: {e}")
+        
+        return fig
+    
+    def _columns(self, subset, columns) -> tuple:
+        """
+        Arrays of the given columns for analyzed events without NaN in the
+        subset columns, masked directly without building a filtered frame.
+        """
+        df_all = self._ensure_analyzed()
+        keep = df_all[subset].notna().to_numpy().all(axis=1)
+        return tuple(df_all[col].to_numpy()[keep] for col in columns)
+    
+    @staticmethod
+    def _subsample(max_points, *arrays) -> tuple:
+        """
+        Reduce parallel arrays to a seeded random subset of max_points rows
+        (order preserved); returned unchanged when already small enough.
+        """
+        n = len(arrays[0])
+        if max_points is None or n <= max_points:
+            return arrays
+        print(f"Plotting a random sample of {max_points} of {n} events")
+        idx = np.sort(np.random.default_rng(0).choice(n, max_points, replace=False))
+        return tuple(a[idx] for a in arrays)
+        
     def plot_epicenter_errors(self, output_file: str = "outputs/epicenter_error_map.png", 
-                              dpi: int = 300):
+                              dpi: int = 300, max_points: int = 20000):
         """
         Create map showing epicenter location errors.
         
         Args:
             output_file: Output filename
             dpi: Resolution in dots per inch
+            max_points: Plot a random sample of at most this many events
+                        (None plots all)
         """
-        if not hasattr(self.analyzer, 'df_analyzed'):
-            self.analyzer.calculate_errors()
-        
-        df = self.analyzer.df_analyzed.dropna(subset=['Epicenter_Error_km'])
+        cat_lon, cat_lat, eew_lon, eew_lat, error = self._subsample(max_points, *self._columns(
+            ['Epicenter_Error_km'],
+            ['Cat_Lon', 'Cat_Lat', 'EEW_Lon', 'EEW_Lat', 'Epicenter_Error_km']))
         
         # Ensure output directory exists
         Path(output_file).parent.mkdir(exist_ok=True, parents=True)
         
         if HAS_PYGMT:
             # Use PyGMT for publication-quality maps
-            fig = pygmt.Figure()
-            
-            # Setup map projection and region
-            region = self.taiwan_region
-            projection = "M15c"
-            
-            # Draw basemap
-            fig.basemap(region=region, projection=projection, frame=["af", "WSne"])
-            fig.coast(region=region, projection=projection, 
-                      land="lightgray", water="lightblue", 
-                      shorelines="1/0.5p,black")
-            
-            # Draw city boundaries from GMT file
-            try:
-                fig.plot(self.city_boundary_file, pen="1p,black")
-            except Exception as e:
-                print(f"Warning: Could not load city boundaries: {e}")
+            fig = self._taiwan_base_map(city_pen="1p,black")
             
             # Plot catalog epicenters (circles)
-            if len(df) > 0:
-                print(f"Plotting {len(df)} epicenter locations...")
+            cpt = None
+            if len(error) > 0:
+                print(f"Plotting {len(error)} epicenter locations...")
                 
                 # Create colormap for epicenter error
-                max_error = df['Epicenter_Error_km'].max()
+                max_error = error.max()
                 print(f"Epicenter error range: 0 - {max_error:.2f} km")
-                pygmt.makecpt(cmap="hot", series=[0, max_error], reverse=True)
+                cpt = self._cpt("hot", [0, max_error], reverse=True)
                 
                 # Plot catalog locations as filled circles colored by error
                 fig.plot(
-                    x=df['Cat_Lon'].values,
-                    y=df['Cat_Lat'].values,
+                    x=cat_lon,
+                    y=cat_lat,
                     size=0.3,
-                    fill=df['Epicenter_Error_km'].values,
-                    cmap=True,
+                    fill=error,
+                    cmap=cpt,
                     style="c",
                     pen="0.5p,black"
                 )
                 
                 # Plot EEW locations as triangles (only where EEW data exists)
-                df_with_eew = df.dropna(subset=['EEW_Lon', 'EEW_Lat'])
-                print(f"Plotting {len(df_with_eew)} EEW locations...")
-                if len(df_with_eew) > 0:
+                has_eew = ~(np.isnan(eew_lon) | np.isnan(eew_lat))
+                n_eew = np.count_nonzero(has_eew)
+                print(f"Plotting {n_eew} EEW locations...")
+                if n_eew > 0:
                     fig.plot(
-                        x=df_with_eew['EEW_Lon'].values,
-                        y=df_with_eew['EEW_Lat'].values,
+                        x=eew_lon[has_eew],
+                        y=eew_lat[has_eew],
                         size=0.25,
                         style="t",
                         fill="blue",
@@ -105,18 +269,15 @@ class EEWSPlotter:
                 print("Warning: No data to plot after filtering!")
             
             # Add colorbar
-            fig.colorbar(frame=["af", "x+lEpicenter Error (km)"], position="JMR+w10c/0.5c+o1c/0c")
+            fig.colorbar(cmap=cpt, frame=["af", "x+lEpicenter Error (km)"], position="JMR+w10c/0.5c+o1c/0c")
             
             # Add legend
             legend_str = """S 0.3c c 0.3c yellow 0.5p,black 0.6c Catalog Location
 S 0.3c t 0.25c blue 0.5p,black 0.6c EEW Location
 S 0.3c - 0.5c red 1p,red 0.6c Location Error"""
             
-            with open("legend_temp.txt", "w") as f:
-                f.write(legend_str)
-            
             fig.legend(
-                spec="legend_temp.txt",
+                spec=self._legend_file("legend_epicenter.txt", legend_str),
                 position="jBL+w5c+o0.3c",
                 box="+gwhite+p1p"
             )
@@ -133,45 +294,40 @@ S 0.3c - 0.5c red 1p,red 0.6c Location Error"""
             fig.savefig(output_file, dpi=dpi)
         else:
             # Fallback to matplotlib with Taiwan coastline outline
-            fig = plt.figure(figsize=(10, 12))
-            ax = plt.gca()
+            # Standalone Agg-backed Figure: no pyplot/GUI figure manager
+            fig = Figure(figsize=(10, 12))
+            ax = fig.add_subplot()
             
             # Add simplified Taiwan coastline (approximate outline)
-            taiwan_coast_lon = [
-                120.0, 120.1, 120.3, 120.5, 120.7, 121.0, 121.3, 121.6, 121.9, 122.0,
-                121.95, 121.9, 121.8, 121.7, 121.6, 121.5, 121.4, 121.3, 121.2, 121.1,
-                121.0, 120.9, 120.8, 120.7, 120.6, 120.5, 120.4, 120.3, 120.2, 120.1, 120.0
-            ]
-            taiwan_coast_lat = [
-                22.0, 22.5, 23.0, 23.5, 24.0, 24.5, 24.8, 25.0, 25.2, 25.3,
-                25.2, 25.0, 24.8, 24.5, 24.2, 24.0, 23.7, 23.4, 23.1, 22.8,
-                22.5, 22.3, 22.1, 22.0, 21.9, 21.9, 21.9, 22.0, 22.0, 22.0, 22.0
-            ]
-            ax.plot(taiwan_coast_lon, taiwan_coast_lat, 'k-', linewidth=1.5, 
+            ax.plot(_TAIWAN_COAST_LON, _TAIWAN_COAST_LAT, 'k-', linewidth=1.5, 
                    label='Taiwan Coast', zorder=1)
-            ax.fill(taiwan_coast_lon, taiwan_coast_lat, color='lightgray', 
+            ax.fill(_TAIWAN_COAST_LON, _TAIWAN_COAST_LAT, color='lightgray', 
                    alpha=0.3, zorder=0)
             
-            # Draw lines connecting catalog to EEW locations
-            for idx, row in df.iterrows():
-                ax.plot([row['Cat_Lon'], row['EEW_Lon']],
-                       [row['Cat_Lat'], row['EEW_Lat']],
-                       'r-', alpha=0.3, linewidth=0.5, zorder=2)
+            # Draw lines connecting catalog to EEW locations, as one
+            # collection of (N, 2 points, lon/lat) segments. For large
+            # catalogs the per-event artists are rasterized so vector outputs
+            # (PDF/SVG) hold one image instead of thousands of paths
+            rasterized = len(error) > self.RASTERIZE_MIN_POINTS
+            segments = np.stack([np.column_stack([cat_lon, eew_lon]),
+                                 np.column_stack([cat_lat, eew_lat])], axis=-1)
+            ax.add_collection(LineCollection(segments, colors='red', alpha=0.3,
+                                             linewidths=0.5, zorder=2, rasterized=rasterized))
             
             # Plot catalog locations
-            scatter = ax.scatter(df['Cat_Lon'], df['Cat_Lat'], 
-                                c=df['Epicenter_Error_km'], 
+            scatter = ax.scatter(cat_lon, cat_lat, 
+                                c=error, 
                                 cmap='hot_r', s=100, alpha=0.7,
                                 edgecolors='black', linewidth=0.5,
-                                label='Catalog Location', zorder=3)
+                                label='Catalog Location', zorder=3, rasterized=rasterized)
             
             # Plot EEW locations
-            ax.scatter(df['EEW_Lon'], df['EEW_Lat'], 
+            ax.scatter(eew_lon, eew_lat, 
                       marker='^', c='blue', s=80, alpha=0.7,
                       edgecolors='black', linewidth=0.5,
-                      label='EEW Location', zorder=3)
+                      label='EEW Location', zorder=3, rasterized=rasterized)
             
-            plt.colorbar(scatter, label='Epicenter Error (km)')
+            fig.colorbar(scatter, label='Epicenter Error (km)')
             ax.set_xlabel('Longitude (°E)', fontsize=12, fontweight='bold')
             ax.set_ylabel('Latitude (°N)', fontsize=12, fontweight='bold')
             ax.set_title('EEWS Epicenter Location Performance', 
@@ -182,9 +338,8 @@ S 0.3c - 0.5c red 1p,red 0.6c Location Error"""
             ax.set_xlim(self.taiwan_region[0], self.taiwan_region[1])
             ax.set_ylim(self.taiwan_region[2], self.taiwan_region[3])
             
-            plt.tight_layout()
-            plt.savefig(output_file, dpi=dpi, bbox_inches='tight')
-            plt.close()
+            fig.tight_layout()
+            self._save_matplotlib(fig, output_file, dpi)
         
         print(f"Epicenter error map saved to: {output_file}")
     
@@ -197,10 +352,7 @@ S 0.3c - 0.5c red 1p,red 0.6c Location Error"""
             output_file: Output filename
             dpi: Resolution
         """
-        if not hasattr(self.analyzer, 'df_analyzed'):
-            self.analyzer.calculate_errors()
-        
-        df = self.analyzer.df_analyzed.dropna(subset=['EEW_Mag'])
+        df = self._analyzed(['EEW_Mag'])
         
         fig = pygmt.Figure()
         
@@ -231,8 +383,8 @@ S 0.3c - 0.5c red 1p,red 0.6c Location Error"""
         
         # Plot data points
         fig.plot(
-            x=df['Cat_Mag'],
-            y=df['EEW_Mag'],
+            x=df['Cat_Mag'].to_numpy(),
+            y=df['EEW_Mag'].to_numpy(),
             style="c0.3c",
             fill="yellow",
             pen="1p,red"
@@ -261,57 +413,44 @@ S 0.3c - 0.5c red 1p,red 0.6c Location Error"""
         print(f"Magnitude comparison plot saved to: {output_file}")
     
     def plot_processing_time_map(self, output_file: str = "outputs/processing_time_map.png",
-                                  dpi: int = 300):
+                                  dpi: int = 300, max_points: int = 20000):
         """
         Create map showing processing time distribution.
         
         Args:
             output_file: Output filename
             dpi: Resolution
+            max_points: Plot a random sample of at most this many events
+                        (None plots all); colors and statistics use all events
         """
-        if not hasattr(self.analyzer, 'df_analyzed'):
-            self.analyzer.calculate_errors()
-        
-        df = self.analyzer.df_analyzed.dropna(subset=['Processing_Time'])
-        
-        fig = pygmt.Figure()
-        
-        # Setup map
-        region = self.taiwan_region
-        projection = "M15c"
+        lon, lat, proc_time = self._columns(
+            ['Processing_Time'], ['Cat_Lon', 'Cat_Lat', 'Processing_Time'])
         
-        fig.basemap(region=region, projection=projection, frame=["af", "WSne"])
-        fig.coast(region=region, projection=projection,
-                  land="lightgray", water="lightblue",
-                  shorelines="1/0.5p,black")
-        
-        # Draw city boundaries from GMT file
-        try:
-            fig.plot(self.city_boundary_file, pen="0.5p,black")
-        except Exception as e:
-            print(f"Warning: Could not plot city boundaries: {e}")
+        fig = self._taiwan_base_map()
         
         # Create colormap for processing time
-        pygmt.makecpt(cmap="jet", series=[df['Processing_Time'].min(), 
-                                          df['Processing_Time'].max()],
-                      reverse=True)
+        cpt = self._cpt("jet", [proc_time.min(), proc_time.max()], reverse=True)
         
         # Scale point size by processing time (scaled for visualization)
-        point_sizes = 0.2 + (df['Processing_Time'] / df['Processing_Time'].max()) * 0.4
+        plot_lon, plot_lat, plot_time = self._subsample(max_points, lon, lat, proc_time)
+        # (0.2 + 0.4 * t / t_max, built in one array)
+        point_sizes = plot_time * (0.4 / proc_time.max())
+        point_sizes += 0.2
         
         # Plot epicenters colored by processing time
         fig.plot(
-            x=df['Cat_Lon'],
-            y=df['Cat_Lat'],
+            x=plot_lon,
+            y=plot_lat,
             size=point_sizes,
-            fill=df['Processing_Time'],
-            cmap=True,
+            fill=plot_time,
+            cmap=cpt,
             style="cc",
             pen="0.5p,black"
         )
         
         # Add colorbar
         fig.colorbar(
+            cmap=cpt,
             frame=["af", "x+lProcessing Time (seconds)"],
             position="JMR+w10c/0.5c+o1c/0c"
         )
@@ -325,8 +464,8 @@ S 0.3c - 0.5c red 1p,red 0.6c Location Error"""
         )
         
         # Add statistics box
-        stats_text = (f"Mean: {df['Processing_Time'].mean():.1f}s\\n"
-                      f"Median: {df['Processing_Time'].median():.1f}s")
+        stats_text = (f"Mean: {proc_time.mean():.1f}s\\n"
+                      f"Median: {np.median(proc_time):.1f}s")
         fig.text(
             text=stats_text,
             position="BL",
@@ -351,28 +490,13 @@ S 0.3c - 0.5c red 1p,red 0.6c Location Error"""
         detected = self.analyzer.get_detected_events()
         missed = self.analyzer.get_missed_events()
         
-        fig = pygmt.Figure()
-        
-        # Setup map
-        region = self.taiwan_region
-        projection = "M15c"
-        
-        fig.basemap(region=region, projection=projection, frame=["af", "WSne"])
-        fig.coast(region=region, projection=projection,
-                  land="lightgray", water="lightblue",
-                  shorelines="1/0.5p,black")
-        
-        # Draw city boundaries from GMT file
-        try:
-            fig.plot(self.city_boundary_file, pen="0.5p,black")
-        except Exception as e:
-            print(f"Warning: Could not plot city boundaries: {e}")
+        fig = self._taiwan_base_map()
         
         # Plot detected events (circles, green)
         if len(detected) > 0:
             fig.plot(
-                x=detected['Cat_Lon'],
-                y=detected['Cat_Lat'],
+                x=detected['Cat_Lon'].to_numpy(),
+                y=detected['Cat_Lat'].to_numpy(),
                 size=0.3,
                 style="cc",
                 fill="green",
@@ -382,8 +506,8 @@ S 0.3c - 0.5c red 1p,red 0.6c Location Error"""
         # Plot missed events (triangles, red)
         if len(missed) > 0:
             fig.plot(
-                x=missed['Cat_Lon'],
-                y=missed['Cat_Lat'],
+                x=missed['Cat_Lon'].to_numpy(),
+                y=missed['Cat_Lat'].to_numpy(),
                 size=0.35,
                 style="t",
                 fill="red",
@@ -394,11 +518,8 @@ S 0.3c - 0.5c red 1p,red 0.6c Location Error"""
         legend_str = f"""S 0.3c c 0.3c green 0.5p,black 0.8c Detected ({len(detected)})
 S 0.3c t 0.35c red 0.5p,black 0.8c Missed ({len(missed)})"""
         
-        with open("legend_temp_missed.txt", "w") as f:
-            f.write(legend_str)
-        
         fig.legend(
-            spec="legend_temp_missed.txt",
+            spec=self._legend_file("legend_missed.txt", legend_str),
             position="jBL+w5c+o0.3c",
             box="+gwhite+p1p"
         )
@@ -424,20 +545,18 @@ S 0.3c t 0.35c red 0.5p,black 0.8c Missed ({len(missed)})"""
             output_file: Output filename
             figsize: Figure size (width, height)
         """
-        if not hasattr(self.analyzer, 'df_analyzed'):
-            self.analyzer.calculate_errors()
-        
-        df = self.analyzer.df_analyzed.dropna(subset=['Processing_Time'])
+        proc_time, = self._columns(['Processing_Time'], ['Processing_Time'])
         
-        fig, ax = plt.subplots(figsize=figsize)
+        fig = Figure(figsize=figsize)
+        ax = fig.subplots()
         
         # Create histogram
-        n, bins, patches = ax.hist(df['Processing_Time'], bins=20, 
-                                     color='skyblue', edgecolor='black', alpha=0.7)
+        _hist_bars(ax, proc_time, bins=20,
+                   color='skyblue', edgecolor='black', alpha=0.7)
         
         # Add vertical lines for mean and median
-        mean_time = df['Processing_Time'].mean()
-        median_time = df['Processing_Time'].median()
+        mean_time = proc_time.mean()
+        median_time = np.median(proc_time)
         
         ax.axvline(mean_time, color='red', linestyle='--', linewidth=2, 
                    label=f'Mean: {mean_time:.1f}s')
@@ -451,9 +570,8 @@ S 0.3c t 0.35c red 0.5p,black 0.8c Missed ({len(missed)})"""
         ax.legend(fontsize=11)
         ax.grid(True, alpha=0.3)
         
-        plt.tight_layout()
-        plt.savefig(output_file, dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.tight_layout()
+        self._save_matplotlib(fig, output_file, 300)
         print(f"Processing time histogram saved to: {output_file}")
     
     def plot_error_distributions(self, output_file: str = "outputs/error_distributions.png",
@@ -465,17 +583,20 @@ S 0.3c t 0.35c red 0.5p,black 0.8c Missed ({len(missed)})"""
             output_file: Output filename
             figsize: Figure size
         """
-        if not hasattr(self.analyzer, 'df_analyzed'):
-            self.analyzer.calculate_errors()
+        df = self._analyzed()
         
-        df = self.analyzer.df_analyzed.dropna()
+        # All summary numbers from one aggregation
+        stats = df[['Epicenter_Error_km', 'Magnitude_Error', 'Depth_Error_km',
+                    'Processing_Time']].agg(['mean', 'std', 'median', 'min', 'max'])
+        mag_rms = self.analyzer.rms(df['Magnitude_Error'].to_numpy())
         
-        fig, axes = plt.subplots(2, 3, figsize=figsize)
+        fig = Figure(figsize=figsize)
+        axes = fig.subplots(2, 3)
         
         # 1. Epicenter error histogram
-        axes[0, 0].hist(df['Epicenter_Error_km'], bins=20, color='coral', 
-                        edgecolor='black', alpha=0.7)
-        axes[0, 0].axvline(df['Epicenter_Error_km'].mean(), color='red', 
+        _hist_bars(axes[0, 0], df['Epicenter_Error_km'].to_numpy(), bins=20, color='coral',
+                   edgecolor='black', alpha=0.7)
+        axes[0, 0].axvline(stats.at['mean', 'Epicenter_Error_km'], color='red', 
                            linestyle='--', linewidth=2)
         axes[0, 0].set_xlabel('Epicenter Error (km)', fontweight='bold')
         axes[0, 0].set_ylabel('Count', fontweight='bold')
@@ -483,9 +604,9 @@ S 0.3c t 0.35c red 0.5p,black 0.8c Missed ({len(missed)})"""
         axes[0, 0].grid(True, alpha=0.3)
         
         # 2. Magnitude error histogram
-        axes[0, 1].hist(df['Magnitude_Error'], bins=20, color='lightgreen',
-                        edgecolor='black', alpha=0.7)
-        axes[0, 1].axvline(df['Magnitude_Error'].mean(), color='red',
+        _hist_bars(axes[0, 1], df['Magnitude_Error'].to_numpy(), bins=20, color='lightgreen',
+                   edgecolor='black', alpha=0.7)
+        axes[0, 1].axvline(stats.at['mean', 'Magnitude_Error'], color='red',
                            linestyle='--', linewidth=2)
         axes[0, 1].set_xlabel('Magnitude Error', fontweight='bold')
         axes[0, 1].set_ylabel('Count', fontweight='bold')
@@ -493,9 +614,9 @@ S 0.3c t 0.35c red 0.5p,black 0.8c Missed ({len(missed)})"""
         axes[0, 1].grid(True, alpha=0.3)
         
         # 3. Depth error histogram
-        axes[0, 2].hist(df['Depth_Error_km'], bins=20, color='skyblue',
-                        edgecolor='black', alpha=0.7)
-        axes[0, 2].axvline(df['Depth_Error_km'].mean(), color='red',
+        _hist_bars(axes[0, 2], df['Depth_Error_km'].to_numpy(), bins=20, color='skyblue',
+                   edgecolor='black', alpha=0.7)
+        axes[0, 2].axvline(stats.at['mean', 'Depth_Error_km'], color='red',
                            linestyle='--', linewidth=2)
         axes[0, 2].set_xlabel('Depth Error (km)', fontweight='bold')
         axes[0, 2].set_ylabel('Count', fontweight='bold')
@@ -510,7 +631,7 @@ S 0.3c t 0.35c red 0.5p,black 0.8c Missed ({len(missed)})"""
         axes[1, 0].set_ylabel('Epicenter Error (km)', fontweight='bold')
         axes[1, 0].set_title('Epicenter Error vs Magnitude', fontweight='bold')
         axes[1, 0].grid(True, alpha=0.3)
-        plt.colorbar(scatter, ax=axes[1, 0], label='Processing Time (s)')
+        fig.colorbar(scatter, ax=axes[1, 0], label='Processing Time (s)')
         
         # 5. Processing time vs depth
         axes[1, 1].scatter(df['Cat_Depth'], df['Processing_Time'],
@@ -530,34 +651,35 @@ S 0.3c t 0.35c red 0.5p,black 0.8c Missed ({len(missed)})"""
         Detection Rate: {len(df)/len(self.analyzer.df)*100:.1f}%
         
         Epicenter Error:
-          Mean: {df['Epicenter_Error_km'].mean():.2f} km
-          Std:  {df['Epicenter_Error_km'].std():.2f} km
+          Mean: {stats.at['mean', 'Epicenter_Error_km']:.2f} km
+          Std:  {stats.at['std', 'Epicenter_Error_km']:.2f} km
         
         Magnitude Error:
-          Mean: {df['Magnitude_Error'].mean():.3f}
-          RMS:  {np.sqrt((df['Magnitude_Error']**2).mean()):.3f}
+          Mean: {stats.at['mean', 'Magnitude_Error']:.3f}
+          RMS:  {mag_rms:.3f}
         
         Processing Time:
-          Mean:   {df['Processing_Time'].mean():.2f} s
-          Median: {df['Processing_Time'].median():.2f} s
-          Range:  {df['Processing_Time'].min():.1f} - {df['Processing_Time'].max():.1f} s
+          Mean:   {stats.at['mean', 'Processing_Time']:.2f} s
+          Median: {stats.at['median', 'Processing_Time']:.2f} s
+          Range:  {stats.at['min', 'Processing_Time']:.1f} - {stats.at['max', 'Processing_Time']:.1f} s
         """
         axes[1, 2].text(0.1, 0.5, stats_text, fontsize=11, family='monospace',
                         verticalalignment='center')
         
-        plt.suptitle('EEWS Performance Analysis - Error Distributions', 
+        fig.suptitle('EEWS Performance Analysis - Error Distributions', 
                      fontsize=16, fontweight='bold', y=0.995)
-        plt.tight_layout()
-        plt.savefig(output_file, dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.tight_layout()
+        self._save_matplotlib(fig, output_file, 300)
         print(f"Error distributions plot saved to: {output_file}")
     
-    def create_all_plots(self, output_dir: str = "outputs"):
+    def create_all_plots(self, output_dir: str = "outputs", parallel: bool = False):
         """
         Create all visualization plots.
         
         Args:
             output_dir: Directory to save figures
+            parallel: Render the figures concurrently in worker processes
+                      (each has its own GMT session and matplotlib state)
         """
         output_path = Path(output_dir)
         output_path.mkdir(exist_ok=True)
@@ -566,35 +688,34 @@ S 0.3c t 0.35c red 0.5p,black 0.8c Missed ({len(missed)})"""
         print("Creating EEWS Performance Visualizations...")
         print("="*70 + "\n")
         
-        try:
-            self.plot_epicenter_errors(str(output_path / "epicenter_error_map.png"))
-        except Exception as e:
-            print(f"Warning: Could not create epicenter error map: {e}")
-        
-        try:
-            self.plot_magnitude_comparison(str(output_path / "magnitude_comparison.png"))
-        except Exception as e:
-            print(f"Warning: Could not create magnitude comparison: {e}")
-        
-        try:
-            self.plot_processing_time_map(str(output_path / "processing_time_map.png"))
-        except Exception as e:
-            print(f"Warning: Could not create processing time map: {e}")
-        
-        try:
-            self.plot_missed_events(str(output_path / "missed_events_map.png"))
-        except Exception as e:
-            print(f"Warning: Could not create missed events map: {e}")
-        
-        try:
-            self.plot_processing_time_histogram(str(output_path / "processing_time_hist.png"))
-        except Exception as e:
-            print(f"Warning: Could not create processing time histogram: {e}")
-        
-        try:
-            self.plot_error_distributions(str(output_path / "error_distributions.png"))
-        except Exception as e:
-            print(f"Warning: Could not create error distributions: {e}")
+        if parallel:
+            # Compute shared state once here so workers receive it ready-made
+            self._analyzed()
+            self._ensure_temp_dir()
+            try:
+                pickle.dumps(self)
+            except Exception as e:
+                print(f"Warning: Cannot send plotter to worker processes ({e}); plotting serially.")
+                parallel = False
+        
+        if parallel:
+            workers = min(len(self.ALL_PLOTS), os.cpu_count() or 1)
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    (executor.submit(_render_plot, self, method, str(output_path / filename)), label)
+                    for method, filename, label in self.ALL_PLOTS
+                ]
+                for future, label in futures:
+                    try:
+                        future.result()
+                    except Exception as e:
+                        print(f"Warning: Could not create {label}: {e}")
+        else:
+            for method, filename, label in self.ALL_PLOTS:
+                try:
+                    getattr(self, method)(str(output_path / filename))
+                except Exception as e:
+                    print(f"Warning: Could not create {label}: {e}")
         
         print("\n" + "="*70)
         print(f"All plots saved to: {output_path}")
@@ -635,12 +756,7 @@ if __name__ == "__main__":
     
     # Apply filters
     original_count = len(analyzer.df)
-    analyzer.df['Origin_Time'] = pd.to_datetime(analyzer.df['Origin_Time'], errors='coerce')
-    analyzer.df = analyzer.df[analyzer.df['Origin_Time'].dt.year == target_year]
-    analyzer.df = analyzer.df[
-        (analyzer.df['Cat_Mag'] >= min_mag) & 
-        (analyzer.df['Cat_Depth'] <= max_depth)
-    ]
+    analyzer.df = analyzer.filter_events(target_year, min_mag, max_depth)
     filtered_count = len(analyzer.df)
     
     print(f"Filtered {filtered_count} events from {original_count} total events\n")
@@ -4,11 +4,47 @@ Quick Examples and Tutorial for EEWS Analyzer
 Demonstrates various usage patterns
 """
 
+import contextlib
+import copy
+import functools
+import io
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
 from eews_analyzer import EEWSAnalyzer
 from eews_plotter import EEWSPlotter
+import numpy as np
 import pandas as pd
 
 
+DATA_FILE = "EEW_ALL-2014-2025.txt"
+
+
+@functools.lru_cache(maxsize=1)
+def _base_analyzer(data_file):
+    """Load and analyze the dataset once; examples work on copies of it"""
+    analyzer = EEWSAnalyzer(data_file)
+    analyzer.load_data()
+    analyzer.calculate_errors()
+    return analyzer
+
+
+def load_analyzer(data_file=DATA_FILE):
+    """
+    Get an analyzer with the data loaded and errors calculated
+    
+    The returned analyzer is a shallow copy of a shared, already analyzed
+    one, so reassigning ``analyzer.df`` (e.g. to a filtered subset) does not
+    affect the other examples.
+    """
+    base = _base_analyzer(data_file)
+    analyzer = copy.copy(base)
+    analyzer.df = base.df.copy(deep=False)
+    analyzer.df_analyzed = base.df_analyzed.copy(deep=False)
+    return analyzer
+
+
 def example_basic_analysis():
     """Example 1: Basic analysis workflow"""
     print("\n" + "="*70)
@@ -16,8 +52,7 @@ def example_basic_analysis():
     print("="*70)
     
     # Initialize and load data
-    analyzer = EEWSAnalyzer("EEW_ALL-2014-2025.txt")
-    analyzer.load_data()
+    analyzer = load_analyzer()
     
     # Calculate errors and statistics
     analyzer.calculate_errors()
@@ -39,8 +74,7 @@ def example_filtered_analysis():
     print("EXAMPLE 2: Filtered Analysis (M >= 5.0, Depth <= 40 km)")
     print("="*70)
     
-    analyzer = EEWSAnalyzer("EEW_ALL-2014-2025.txt")
-    analyzer.load_data()
+    analyzer = load_analyzer()
     
     # Apply filters
     print(f"\nOriginal dataset: {len(analyzer.df)} events")
@@ -63,8 +97,7 @@ def example_regional_analysis():
     print("EXAMPLE 3: Regional Analysis (Central Taiwan)")
     print("="*70)
     
-    analyzer = EEWSAnalyzer("EEW_ALL-2014-2025.txt")
-    analyzer.load_data()
+    analyzer = load_analyzer()
     
     # Filter by region (central Taiwan)
     lon_range = (120.5, 121.5)
@@ -89,8 +122,7 @@ def example_detection_comparison():
     print("EXAMPLE 4: Detected vs Missed Events Comparison")
     print("="*70)
     
-    analyzer = EEWSAnalyzer("EEW_ALL-2014-2025.txt")
-    analyzer.load_data()
+    analyzer = load_analyzer()
     
     # Get detected and missed events
     detected = analyzer.get_detected_events()
@@ -101,11 +133,13 @@ def example_detection_comparison():
     print(f"Detection Rate: {len(detected)/(len(detected)+len(missed))*100:.1f}%")
     
     # Statistics for missed events
+    missed_stats = missed[['Cat_Mag', 'Cat_Depth']].agg(['mean', 'min', 'max'])
+    mag, depth = missed_stats['Cat_Mag'], missed_stats['Cat_Depth']
     print(f"\nMissed Events Characteristics:")
-    print(f"  Mean Magnitude: {missed['Cat_Mag'].mean():.2f}")
-    print(f"  Mean Depth: {missed['Cat_Depth'].mean():.2f} km")
-    print(f"  Magnitude Range: {missed['Cat_Mag'].min():.2f} - {missed['Cat_Mag'].max():.2f}")
-    print(f"  Depth Range: {missed['Cat_Depth'].min():.2f} - {missed['Cat_Depth'].max():.2f} km")
+    print(f"  Mean Magnitude: {mag['mean']:.2f}")
+    print(f"  Mean Depth: {depth['mean']:.2f} km")
+    print(f"  Magnitude Range: {mag['min']:.2f} - {mag['max']:.2f}")
+    print(f"  Depth Range: {depth['min']:.2f} - {depth['max']:.2f} km")
 
 
 def example_custom_visualization():
@@ -114,9 +148,7 @@ def example_custom_visualization():
     print("EXAMPLE 5: Custom Visualizations")
     print("="*70)
     
-    analyzer = EEWSAnalyzer("EEW_ALL-2014-2025.txt")
-    analyzer.load_data()
-    analyzer.calculate_errors()
+    analyzer = load_analyzer()
     
     # Create plotter
     plotter = EEWSPlotter(analyzer)
@@ -137,9 +169,7 @@ def example_data_export():
     print("EXAMPLE 6: Data Export")
     print("="*70)
     
-    analyzer = EEWSAnalyzer("EEW_ALL-2014-2025.txt")
-    analyzer.load_data()
-    analyzer.calculate_errors()
+    analyzer = load_analyzer()
     
     # Save full analysis results
     analyzer.save_results("full_analysis.csv")
@@ -164,26 +194,27 @@ def example_processing_time_analysis():
     print("EXAMPLE 7: Processing Time Analysis")
     print("="*70)
     
-    analyzer = EEWSAnalyzer("EEW_ALL-2014-2025.txt")
-    analyzer.load_data()
-    analyzer.calculate_errors()
+    analyzer = load_analyzer()
     
     df = analyzer.df_analyzed
     
-    # Categorize by processing time
-    fast = df[df['Processing_Time'] <= 10]
-    medium = df[(df['Processing_Time'] > 10) & (df['Processing_Time'] <= 20)]
-    slow = df[df['Processing_Time'] > 20]
+    # Categorize by processing time in one pass
+    category = pd.cut(df['Processing_Time'], [-np.inf, 10, 20, np.inf],
+                      labels=['fast', 'medium', 'slow'])
+    by_time = df.groupby(category, observed=False).agg(
+        count=('Processing_Time', 'size'),
+        mean_error=('Epicenter_Error_km', 'mean'))
+    fast, medium, slow = (by_time.loc[name] for name in ('fast', 'medium', 'slow'))
     
     print(f"\nProcessing Time Categories:")
-    print(f"  Fast (≤ 10s):   {len(fast)} events ({len(fast)/len(df)*100:.1f}%)")
-    print(f"  Medium (10-20s): {len(medium)} events ({len(medium)/len(df)*100:.1f}%)")
-    print(f"  Slow (> 20s):    {len(slow)} events ({len(slow)/len(df)*100:.1f}%)")
+    print(f"  Fast (≤ 10s):   {fast['count']:.0f} events ({fast['count']/len(df)*100:.1f}%)")
+    print(f"  Medium (10-20s): {medium['count']:.0f} events ({medium['count']/len(df)*100:.1f}%)")
+    print(f"  Slow (> 20s):    {slow['count']:.0f} events ({slow['count']/len(df)*100:.1f}%)")
     
     print(f"\nAccuracy by Processing Time:")
-    print(f"  Fast - Mean Epicenter Error: {fast['Epicenter_Error_km'].mean():.2f} km")
-    print(f"  Medium - Mean Epicenter Error: {medium['Epicenter_Error_km'].mean():.2f} km")
-    print(f"  Slow - Mean Epicenter Error: {slow['Epicenter_Error_km'].mean():.2f} km")
+    print(f"  Fast - Mean Epicenter Error: {fast['mean_error']:.2f} km")
+    print(f"  Medium - Mean Epicenter Error: {medium['mean_error']:.2f} km")
+    print(f"  Slow - Mean Epicenter Error: {slow['mean_error']:.2f} km")
 
 
 def example_magnitude_accuracy():
@@ -192,51 +223,85 @@ def example_magnitude_accuracy():
     print("EXAMPLE 8: Magnitude Accuracy by Magnitude Range")
     print("="*70)
     
-    analyzer = EEWSAnalyzer("EEW_ALL-2014-2025.txt")
-    analyzer.load_data()
-    analyzer.calculate_errors()
+    analyzer = load_analyzer()
     
     df = analyzer.df_analyzed
     
-    # Analyze by magnitude bins
-    mag_bins = [(4, 5), (5, 6), (6, 7), (7, 10)]
+    # Analyze by magnitude bins [4, 5), [5, 6), [6, 7), [7, 10) in one pass
+    mag_bins = pd.cut(df['Cat_Mag'], [4, 5, 6, 7, 10], right=False)
+    by_mag = df.assign(Magnitude_Error_Sq=df['Magnitude_Error']**2).groupby(
+        mag_bins, observed=True).agg(
+            count=('Magnitude_Error', 'size'),
+            mean=('Magnitude_Error', 'mean'),
+            std=('Magnitude_Error', 'std'),
+            mean_sq=('Magnitude_Error_Sq', 'mean'))
     
     print("\nMagnitude Error by Magnitude Range:")
-    for mag_min, mag_max in mag_bins:
-        subset = df[(df['Cat_Mag'] >= mag_min) & (df['Cat_Mag'] < mag_max)]
-        if len(subset) > 0:
-            print(f"\n  M {mag_min}-{mag_max}:")
-            print(f"    Count: {len(subset)}")
-            print(f"    Mean Error: {subset['Magnitude_Error'].mean():.3f}")
-            print(f"    Std Dev: {subset['Magnitude_Error'].std():.3f}")
-            print(f"    RMS Error: {(subset['Magnitude_Error']**2).mean()**0.5:.3f}")
-
-
-def run_all_examples():
-    """Run all examples"""
-    examples = [
-        example_basic_analysis,
-        example_filtered_analysis,
-        example_regional_analysis,
-        example_detection_comparison,
-        example_custom_visualization,
-        example_data_export,
-        example_processing_time_analysis,
-        example_magnitude_accuracy
-    ]
-    
+    for interval, row in by_mag.iterrows():
+        print(f"\n  M {interval.left}-{interval.right}:")
+        print(f"    Count: {row['count']:.0f}")
+        print(f"    Mean Error: {row['mean']:.3f}")
+        print(f"    Std Dev: {row['std']:.3f}")
+        print(f"    RMS Error: {row['mean_sq']**0.5:.3f}")
+
+
+EXAMPLES = (
+    example_basic_analysis,
+    example_filtered_analysis,
+    example_regional_analysis,
+    example_detection_comparison,
+    example_custom_visualization,
+    example_data_export,
+    example_processing_time_analysis,
+    example_magnitude_accuracy
+)
+
+
+def _run_captured(example):
+    """Run one example and return everything it printed"""
+    buffer = io.StringIO()
+    with contextlib.redirect_stdout(buffer):
+        try:
+            example()
+        except Exception as e:
+            print(f"\n{example.__name__} encountered an error: {e}")
+    return buffer.getvalue()
+
+
+def run_all_examples(interactive=True):
+    """
+    Run all examples
+    
+    Args:
+        interactive: Pause between examples. When False the examples run
+                     in a process pool and their output is printed in order.
+    """
     print("\n" + "#"*70)
     print("# EEWS ANALYZER - EXAMPLES AND TUTORIALS")
     print("#"*70)
     
-    for i, example in enumerate(examples, 1):
-        try:
-            example()
-        except Exception as e:
-            print(f"\nExample {i} encountered an error: {e}")
-        
-        if i < len(examples):
-            input("\nPress Enter to continue to next example...")
+    if interactive:
+        for i, example in enumerate(EXAMPLES, 1):
+            try:
+                example()
+            except Exception as e:
+                print(f"\nExample {i} encountered an error: {e}")
+            
+            if i < len(EXAMPLES):
+                input("\nPress Enter to continue to next example...")
+    else:
+        # fork lets the workers reuse the already imported pandas/matplotlib
+        context = None
+        if 'fork' in multiprocessing.get_all_start_methods():
+            context = multiprocessing.get_context('fork')
+            # Load once here so the forked workers inherit the analyzed data;
+            # on failure each example reports the error itself
+            with contextlib.suppress(Exception):
+                _base_analyzer(DATA_FILE)
+        workers = min(len(EXAMPLES), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+            for output in executor.map(_run_captured, EXAMPLES):
+                print(output, end='')
     
     print("\n" + "#"*70)
     print("# ALL EXAMPLES COMPLETED!")
@@ -246,23 +311,19 @@ def run_all_examples():
 if __name__ == "__main__":
     import sys
     
-    if len(sys.argv) > 1:
-        example_num = int(sys.argv[1])
-        examples = [
-            example_basic_analysis,
-            example_filtered_analysis,
-            example_regional_analysis,
-            example_detection_comparison,
-            example_custom_visualization,
-            example_data_export,
-            example_processing_time_analysis,
-            example_magnitude_accuracy
-        ]
+    if len(sys.argv) > 1 and sys.argv[1] == '--batch':
+        # Run all examples without pausing
+        run_all_examples(interactive=False)
+    elif len(sys.argv) > 1:
+        try:
+            example_num = int(sys.argv[1])
+        except ValueError:
+            example_num = 0
         
-        if 1 <= example_num <= len(examples):
-            examples[example_num - 1]()
+        if 1 <= example_num <= len(EXAMPLES):
+            EXAMPLES[example_num - 1]()
         else:
-            print(f"Invalid example number. Choose 1-{len(examples)}")
+            print(f"Invalid example number. Choose 1-{len(EXAMPLES)}")
     else:
         # Run all examples interactively
         run_all_examples()
@@ -5,11 +5,18 @@ Provides earthquake early warning system analysis capabilities via Model Context
 """
 
 import sys
+import asyncio
+import copy
+import functools
 import json
+import os
+import time
 from pathlib import Path
-from typing import Any, Sequence
+from typing import Any, Optional, Sequence, Tuple
 import logging
 
+import numpy as np
+
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
@@ -42,7 +49,12 @@ _analyzer_cache = {}
 
 
 def get_analyzer(data_file: str) -> EEWSAnalyzer:
-    """Get or create analyzer instance for a data file"""
+    """
+    Get or create analyzer instance for a data file.
+    
+    The cached analyzer always holds the full dataset; filtered analyses
+    work on copies (see get_filtered_stats) and must not reassign its df.
+    """
     if data_file not in _analyzer_cache:
         logger.info(f"Initializing analyzer for {data_file}")
         analyzer = EEWSAnalyzer(data_file)
@@ -52,6 +64,46 @@ def get_analyzer(data_file: str) -> EEWSAnalyzer:
     return _analyzer_cache[data_file]
 
 
+@functools.lru_cache(maxsize=128)
+def get_filtered_stats(data_file: str,
+                       mag_range: Optional[Tuple[float, float]] = None,
+                       max_depth: Optional[float] = None,
+                       lon_range: Optional[Tuple[float, float]] = None,
+                       lat_range: Optional[Tuple[float, float]] = None) -> dict:
+    """
+    Statistics for the events of data_file within the given (inclusive)
+    ranges; None leaves that dimension unfiltered.
+    
+    Results are memoized per argument tuple, so repeated tool calls with the
+    same filters cost a dictionary lookup.
+    """
+    base = get_analyzer(data_file)
+    if mag_range is None and max_depth is None and lon_range is None and lat_range is None:
+        return base.get_statistics()
+    
+    # One combined mask over the needed columns, applied once
+    df = base.df
+    keep = np.ones(len(df), dtype=bool)
+    if mag_range is not None:
+        mag = df['Cat_Mag'].to_numpy()
+        keep &= (mag >= mag_range[0]) & (mag <= mag_range[1])
+    if max_depth is not None:
+        keep &= df['Cat_Depth'].to_numpy() <= max_depth
+    if lon_range is not None:
+        lon = df['Cat_Lon'].to_numpy()
+        keep &= (lon >= lon_range[0]) & (lon <= lon_range[1])
+    if lat_range is not None:
+        lat = df['Cat_Lat'].to_numpy()
+        keep &= (lat >= lat_range[0]) & (lat <= lat_range[1])
+    
+    # Shallow copy: the filtered frame and results live on the copy only
+    analyzer = copy.copy(base)
+    analyzer.df = df[keep]
+    analyzer.results = {}
+    analyzer.calculate_errors()
+    return analyzer.get_statistics()
+
+
 @server.list_tools()
 async def list_tools() -> list[Tool]:
     """List available EEWS analysis tools"""
@@ -168,6 +220,11 @@ async def list_tools() -> list[Tool]:
                         "type": "string",
                         "description": "Output directory for figures (default: figures)",
                         "default": "figures"
+                    },
+                    "parallel": {
+                        "type": "boolean",
+                        "description": "For plot_type 'all': render the figures concurrently in worker processes (default: false)",
+                        "default": False
                     }
                 },
                 "required": ["data_file", "plot_type"]
@@ -175,7 +232,7 @@ async def list_tools() -> list[Tool]:
         ),
         Tool(
             name="export_analysis_results",
-            description="Export analyzed EEWS data to CSV file with all calculated errors and metrics",
+            description="Export analyzed EEWS data to a CSV (or Parquet/Feather/pickle) file with all calculated errors and metrics",
             inputSchema={
                 "type": "object",
                 "properties": {
@@ -187,6 +244,11 @@ async def list_tools() -> list[Tool]:
                         "type": "string",
                         "description": "Output CSV file path",
                         "default": "eews_analysis_results.csv"
+                    },
+                    "output_format": {
+                        "type": "string",
+                        "description": "File format; replaces the output_file extension (default: taken from output_file, CSV otherwise). parquet and feather need pyarrow",
+                        "enum": ["csv", "parquet", "feather", "pkl"]
                     }
                 },
                 "required": ["data_file"]
@@ -243,21 +305,15 @@ async def call_tool(name: str, arguments: Any) -> Sequence[TextContent | ImageCo
     try:
         if name == "analyze_eews_data":
             data_file = arguments["data_file"]
-            analyzer = get_analyzer(data_file)
             
             # Apply filters if provided
+            mag_range = None
             if "min_magnitude" in arguments or "max_magnitude" in arguments:
-                min_mag = arguments.get("min_magnitude", 0.0)
-                max_mag = arguments.get("max_magnitude", 10.0)
-                analyzer.df = analyzer.filter_by_magnitude(min_mag, max_mag)
-                analyzer.calculate_errors()
-            
-            if "max_depth" in arguments:
-                max_depth = arguments["max_depth"]
-                analyzer.df = analyzer.filter_by_depth(max_depth)
-                analyzer.calculate_errors()
+                mag_range = (arguments.get("min_magnitude", 0.0),
+                             arguments.get("max_magnitude", 10.0))
             
-            stats = analyzer.get_statistics()
+            stats = get_filtered_stats(data_file, mag_range=mag_range,
+                                       max_depth=arguments.get("max_depth"))
             
             # Format response
             response = f"""EEWS Performance Analysis Results
@@ -294,8 +350,7 @@ PROCESSING TIME (seconds):
         
         elif name == "get_detection_statistics":
             data_file = arguments["data_file"]
-            analyzer = get_analyzer(data_file)
-            stats = analyzer.get_statistics()
+            stats = get_filtered_stats(data_file)
             
             response = f"""Detection Statistics:
 - Total Earthquakes: {stats['total_earthquakes']}
@@ -307,8 +362,7 @@ PROCESSING TIME (seconds):
         
         elif name == "get_epicenter_error_statistics":
             data_file = arguments["data_file"]
-            analyzer = get_analyzer(data_file)
-            stats = analyzer.get_statistics()
+            stats = get_filtered_stats(data_file)
             
             response = f"""Epicenter Error Statistics (km):
 - Mean Error: {stats['epicenter_error_mean_km']:.2f}
@@ -321,8 +375,7 @@ PROCESSING TIME (seconds):
         
         elif name == "get_magnitude_error_statistics":
             data_file = arguments["data_file"]
-            analyzer = get_analyzer(data_file)
-            stats = analyzer.get_statistics()
+            stats = get_filtered_stats(data_file)
             
             response = f"""Magnitude Error Statistics:
 - Mean Error: {stats['magnitude_error_mean']:.3f}
@@ -333,8 +386,7 @@ PROCESSING TIME (seconds):
         
         elif name == "get_processing_time_statistics":
             data_file = arguments["data_file"]
-            analyzer = get_analyzer(data_file)
-            stats = analyzer.get_statistics()
+            stats = get_filtered_stats(data_file)
             
             response = f"""Processing Time Statistics (seconds):
 - Mean Time: {stats['processing_time_mean_s']:.2f}
@@ -357,7 +409,7 @@ PROCESSING TIME (seconds):
             output_path.mkdir(exist_ok=True)
             
             if plot_type == "all":
-                plotter.create_all_plots(output_dir)
+                plotter.create_all_plots(output_dir, parallel=arguments.get("parallel", False))
                 response = f"All visualization plots created successfully in {output_dir}/"
             else:
                 plot_map = {
@@ -379,6 +431,9 @@ PROCESSING TIME (seconds):
         elif name == "export_analysis_results":
             data_file = arguments["data_file"]
             output_file = arguments.get("output_file", "eews_analysis_results.csv")
+            output_format = arguments.get("output_format")
+            if output_format:
+                output_file = str(Path(output_file).with_suffix("." + output_format))
             
             analyzer = get_analyzer(data_file)
             analyzer.save_results(output_file)
@@ -388,30 +443,16 @@ PROCESSING TIME (seconds):
         
         elif name == "compare_regions":
             data_file = arguments["data_file"]
-            analyzer = EEWSAnalyzer(data_file)
-            analyzer.load_data()
             
             # Region 1
             region1_lon = tuple(arguments["region1_lon_range"])
             region1_lat = tuple(arguments["region1_lat_range"])
-            df1 = analyzer.filter_by_region(region1_lon, region1_lat)
-            
-            # Calculate stats for region 1
-            analyzer.df = df1
-            analyzer.calculate_errors()
-            stats1 = analyzer.get_statistics()
+            stats1 = get_filtered_stats(data_file, lon_range=region1_lon, lat_range=region1_lat)
             
             # Region 2
-            analyzer = EEWSAnalyzer(data_file)
-            analyzer.load_data()
             region2_lon = tuple(arguments["region2_lon_range"])
             region2_lat = tuple(arguments["region2_lat_range"])
-            df2 = analyzer.filter_by_region(region2_lon, region2_lat)
-            
-            # Calculate stats for region 2
-            analyzer.df = df2
-            analyzer.calculate_errors()
-            stats2 = analyzer.get_statistics()
+            stats2 = get_filtered_stats(data_file, lon_range=region2_lon, lat_range=region2_lat)
             
             response = f"""Regional Comparison Analysis
 {'='*60}
@@ -443,9 +484,27 @@ COMPARISON:
         return [TextContent(type="text", text=f"Error: {str(e)}")]
 
 
+def _preload(data_file: str):
+    """Load, analyze and compute the statistics of one data file"""
+    start = time.perf_counter()
+    try:
+        get_filtered_stats(data_file)
+    except Exception as e:
+        logger.warning(f"Could not preload {data_file}: {e}")
+    else:
+        logger.info(f"Preloaded {data_file} in {time.perf_counter() - start:.2f} s")
+
+
 async def main():
     """Run the MCP server"""
     logger.info("Starting EEWS Analyzer MCP Server")
+    
+    # Data files listed in EEWS_PRELOAD_FILES (separated like PATH) are
+    # analyzed before serving, so the first tool call does not pay for it
+    preload = [f for f in os.environ.get("EEWS_PRELOAD_FILES", "").split(os.pathsep) if f]
+    if preload:
+        await asyncio.gather(*(asyncio.to_thread(_preload, f) for f in dict.fromkeys(preload)))
+    
     async with stdio_server() as (read_stream, write_stream):
         await server.run(
             read_stream,
@@ -455,5 +514,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    import asyncio
     asyncio.run(main())
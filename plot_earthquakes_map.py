@@ -18,27 +18,26 @@ plt.rcParams['axes.unicode_minus'] = False
 def load_taiwan_boundary(boundary_file='taiwan.txt'):
     """加载台湾边界数据"""
     try:
-        lons, lats = [], []
-        with open(boundary_file, 'r') as f:
-            for line in f:
-                data = line.split()
-                if len(data) >= 2:
-                    lons.append(float(data[0]))
-                    lats.append(float(data[1]))
-        return lons, lats
+        coords = np.loadtxt(boundary_file, usecols=(0, 1), ndmin=2)
+        return coords[:, 0], coords[:, 1]
     except FileNotFoundError:
         print(f"Warning: Boundary file '{boundary_file}' not found.")
-        return [], []
+        return np.empty(0), np.empty(0)
 
 
 def magnitude_to_size(magnitude, scale_factor=50):
-    """将地震规模转换为圆圈大小"""
+    """将地震规模转换为圆圈大小（标量或数组）"""
     # 使用指数函数使大地震更明显
     return scale_factor * (magnitude ** 2)
 
 
-def plot_earthquakes():
-    """绘制地震分布图"""
+def plot_earthquakes(show=True):
+    """
+    绘制地震分布图
+    
+    Args:
+        show: 保存后是否显示图形；图形最后都会关闭
+    """
     
     # 读取地震数据
     print("正在读取地震数据...")
@@ -49,16 +48,14 @@ def plot_earthquakes():
         print("请先运行 analyze_2014_2024_summary.py 生成数据文件")
         return
     
-    df = pd.read_csv(eq_file, encoding='utf-8-sig')
-    
-    # 转换数据类型
-    df['经度'] = pd.to_numeric(df['经度'], errors='coerce')
-    df['纬度'] = pd.to_numeric(df['纬度'], errors='coerce')
-    df['规模'] = pd.to_numeric(df['规模'], errors='coerce')
+    # 只读取需要的列，数值列直接解析为浮点数
+    df = pd.read_csv(eq_file, encoding='utf-8-sig',
+                     usecols=['经度', '纬度', '规模', '岛内/外海'],
+                     dtype={'经度': 'float64', '纬度': 'float64', '规模': 'float64'})
     
     # 分类岛内和外海地震
-    df_inland = df[df['岛内/外海'] == '岛内'].copy()
-    df_offshore = df[df['岛内/外海'] == '外海'].copy()
+    df_inland = df[df['岛内/外海'] == '岛内']
+    df_offshore = df[df['岛内/外海'] == '外海']
     
     print(f"岛内地震: {len(df_inland)} 笔")
     print(f"外海地震: {len(df_offshore)} 笔")
@@ -70,7 +67,7 @@ def plot_earthquakes():
     fig, ax = plt.subplots(figsize=(12, 14))
     
     # 绘制台湾边界
-    if boundary_lons:
+    if len(boundary_lons) > 0:
         ax.plot(boundary_lons, boundary_lats, 'k-', linewidth=1.5, 
                 label='台湾边界', zorder=1, alpha=0.6)
     
@@ -80,7 +77,7 @@ def plot_earthquakes():
     
     # 绘制外海地震（先画，使其在下层）
     if len(df_offshore) > 0:
-        sizes_offshore = df_offshore['规模'].apply(magnitude_to_size)
+        sizes_offshore = magnitude_to_size(df_offshore['规模'].to_numpy())
         scatter_offshore = ax.scatter(
             df_offshore['经度'], 
             df_offshore['纬度'],
@@ -96,7 +93,7 @@ def plot_earthquakes():
     
     # 绘制岛内地震（后画，使其在上层）
     if len(df_inland) > 0:
-        sizes_inland = df_inland['规模'].apply(magnitude_to_size)
+        sizes_inland = magnitude_to_size(df_inland['规模'].to_numpy())
         scatter_inland = ax.scatter(
             df_inland['经度'], 
             df_inland['纬度'],
@@ -119,9 +116,10 @@ def plot_earthquakes():
     legend_elements.append(mpatches.Patch(color=offshore_color, label=f'外海地震 (n={len(df_offshore)})'))
     
     # 添加规模参考
-    for mag in legend_mags:
+    legend_sizes = magnitude_to_size(np.array(legend_mags))
+    for mag, size in zip(legend_mags, legend_sizes):
         legend_elements.append(
-            plt.scatter([], [], s=magnitude_to_size(mag), 
+            plt.scatter([], [], s=size, 
                        c='gray', alpha=0.5, edgecolors='black',
                        label=f'M = {mag}')
         )
@@ -183,10 +181,19 @@ def plot_earthquakes():
     print(f"\n图形已保存至: {output_file}")
     
     # 显示图形
-    plt.show()
+    if show:
+        plt.show()
+    plt.close(fig)
     
     print("\n完成!")
 
 
 if __name__ == "__main__":
-    plot_earthquakes()
+    import sys
+    
+    # --no-show: 只保存图形，不打开窗口（批处理用）
+    show = '--no-show' not in sys.argv[1:]
+    if not show:
+        # 无需窗口时改用 Agg 后端，省去 GUI 初始化
+        plt.switch_backend('Agg')
+    plot_earthquakes(show=show)
@@ -4,7 +4,6 @@ Distinguishes inland and offshore earthquakes with different colors
 Circle sizes represent earthquake magnitude
 """
 
-import pygmt
 import pandas as pd
 import numpy as np
 
@@ -18,27 +17,28 @@ def plot_earthquake_distribution_gmt(output_file="outputs/earthquake_distributio
         output_file: Output filename
         dpi: Resolution in dots per inch
     """
+    # Imported here: GMT session startup is only paid when a map is drawn
+    import pygmt
     
     # Read earthquake data
     print("正在读取地震数据...")
     eq_file = 'outputs/earthquake_list_2014_2025.csv'
     
     try:
-        df = pd.read_csv(eq_file, encoding='utf-8-sig')
+        # Read only the columns used below; numeric ones parse straight to float
+        df = pd.read_csv(
+            eq_file, encoding='utf-8-sig',
+            usecols=['经度', '纬度', '规模', '是否发布预警', '处理时效(秒)'],
+            dtype={'经度': 'float64', '纬度': 'float64', '规模': 'float64',
+                   '处理时效(秒)': 'float64'}
+        )
     except FileNotFoundError:
         print(f"错误: 找不到文件 {eq_file}")
         print("请先运行 analyze_2014_2024_summary.py 生成数据文件")
         return
     
-    # Convert data types
-    df['经度'] = pd.to_numeric(df['经度'], errors='coerce')
-    df['纬度'] = pd.to_numeric(df['纬度'], errors='coerce')
-    df['规模'] = pd.to_numeric(df['规模'], errors='coerce')
-    df['处理时效(秒)'] = pd.to_numeric(df['处理时效(秒)'], errors='coerce')
-    
     # Filter only events with EEW (with processing time)
-    df = df[df['是否发布预警'] == '是'].copy()
-    df = df.dropna(subset=['处理时效(秒)']).copy()
+    df = df[(df['是否发布预警'] == '是') & df['处理时效(秒)'].notna()]
     
     print(f"具有处理时效的地震: {len(df)} 笔")
     print(f"处理时效范围: {df['处理时效(秒)'].min():.0f} - {df['处理时效(秒)'].max():.0f} 秒")
@@ -86,8 +86,8 @@ def plot_earthquake_distribution_gmt(output_file="outputs/earthquake_distributio
         """Convert magnitude to circle size in cm"""
         return 0.05 * (mag ** 2) * 0.3  # Reduced to 0.3x original size
     
-    # Calculate circle sizes
-    circle_sizes = df['规模'].apply(mag_to_size).values
+    # Calculate circle sizes (vectorized over the whole column)
+    circle_sizes = mag_to_size(df['规模'].to_numpy())
     
     # Get processing times for color mapping
     processing_times = df['处理时效(秒)'].values
@@ -3,8 +3,6 @@ Plot epicenter error map with proportional circles (publication style)
 Creates a black and white map with circle sizes representing epicenter error magnitude
 """
 
-import pygmt
-import pandas as pd
 import numpy as np
 from eews_analyzer import EEWSAnalyzer
 
@@ -18,10 +16,19 @@ def plot_epicenter_error_circles(analyzer, output_file="outputs/epicenter_error_
         output_file: Output filename
         dpi: Resolution in dots per inch
     """
+    # Imported here: GMT session startup is only paid when a map is drawn
+    import pygmt
+    
     if not hasattr(analyzer, 'df_analyzed'):
         analyzer.calculate_errors()
     
-    df = analyzer.df_analyzed.dropna(subset=['Epicenter_Error_km'])
+    # Column arrays of the events with an epicenter error
+    df = analyzer.df_analyzed
+    errors = df['Epicenter_Error_km'].to_numpy(dtype=np.float64)
+    valid = ~np.isnan(errors)
+    errors = errors[valid]
+    lons = df['Cat_Lon'].to_numpy()[valid]
+    lats = df['Cat_Lat'].to_numpy()[valid]
     
     # Taiwan region
     region = [119.85, 123.1, 21.2, 25.7]
@@ -48,15 +55,15 @@ def plot_epicenter_error_circles(analyzer, output_file="outputs/epicenter_error_
     # Use a scaling factor to make circles visible
     scale_factor = 0.015  # Adjust this to control circle sizes
     
-    print(f"Plotting {len(df)} circles...")
+    print(f"Plotting {len(errors)} circles...")
     
     # Calculate circle sizes for all points
-    circle_sizes = df['Epicenter_Error_km'].values * scale_factor
+    circle_sizes = errors * scale_factor
     
     # Plot all circles at once
     fig.plot(
-        x=df['Cat_Lon'].values,
-        y=df['Cat_Lat'].values,
+        x=lons,
+        y=lats,
         size=circle_sizes,
         style="c",
         pen="0.5p,black",
@@ -104,12 +111,7 @@ if __name__ == "__main__":
     
     # Apply filters
     original_count = len(analyzer.df)
-    analyzer.df['Origin_Time'] = pd.to_datetime(analyzer.df['Origin_Time'], errors='coerce')
-    analyzer.df = analyzer.df[analyzer.df['Origin_Time'].dt.year == target_year]
-    analyzer.df = analyzer.df[
-        (analyzer.df['Cat_Mag'] >= min_mag) & 
-        (analyzer.df['Cat_Depth'] <= max_depth)
-    ]
+    analyzer.df = analyzer.filter_events(target_year, min_mag, max_depth)
     filtered_count = len(analyzer.df)
     
     print(f"Filtered {filtered_count} events from {original_count} total events\n")
@@ -5,7 +5,7 @@ Plot epicenter error histogram.
 import sys
 from pathlib import Path
 
-import pandas as pd
+import numpy as np
 import matplotlib.pyplot as plt
 
 from eews_analyzer import EEWSAnalyzer
@@ -24,15 +24,20 @@ def plot_epicenter_error_histogram(analyzer, output_file="outputs/epicenter_erro
     if not hasattr(analyzer, "df_analyzed"):
         analyzer.calculate_errors()
 
-    df = analyzer.df_analyzed.dropna(subset=["Epicenter_Error_km"])
+    errors = analyzer.df_analyzed["Epicenter_Error_km"].to_numpy(dtype=np.float64)
+    errors = errors[~np.isnan(errors)]
 
     Path(output_file).parent.mkdir(exist_ok=True, parents=True)
 
     fig, ax = plt.subplots(figsize=(10, 6))
-    ax.hist(df["Epicenter_Error_km"], bins=bins, color="steelblue", edgecolor="black", alpha=0.8)
 
-    mean_err = df["Epicenter_Error_km"].mean()
-    median_err = df["Epicenter_Error_km"].median()
+    # Bin in one np.histogram call and draw the counts as edge-aligned bars
+    counts, edges = np.histogram(errors, bins=bins)
+    ax.bar(edges[:-1], counts, width=np.diff(edges), align="edge",
+           color="steelblue", edgecolor="black", alpha=0.8)
+
+    mean_err = errors.mean()
+    median_err = np.median(errors)
     ax.axvline(mean_err, color="red", linestyle="--", linewidth=2, label=f"Mean: {mean_err:.2f} km")
     ax.axvline(median_err, color="green", linestyle="--", linewidth=2, label=f"Median: {median_err:.2f} km")
 
@@ -79,12 +84,7 @@ if __name__ == "__main__":
     analyzer.load_data()
 
     original_count = len(analyzer.df)
-    analyzer.df["Origin_Time"] = pd.to_datetime(analyzer.df["Origin_Time"], errors="coerce")
-    analyzer.df = analyzer.df[analyzer.df["Origin_Time"].dt.year == target_year]
-    analyzer.df = analyzer.df[
-        (analyzer.df["Cat_Mag"] >= min_mag)
-        & (analyzer.df["Cat_Depth"] <= max_depth)
-    ]
+    analyzer.df = analyzer.filter_events(target_year, min_mag, max_depth)
     filtered_count = len(analyzer.df)
 
     print(f"Filtered {filtered_count} events from {original_count} total events\n")